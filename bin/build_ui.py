@@ -2,6 +2,7 @@
 
 import os.path
 import argparse
+import re
 import datetime as dt
 from append_license import append_license
 
@@ -34,6 +35,30 @@ def fix_resources_imports(path):
         out_file.writelines(lines)
 
 
+# Signals that have overloads with different arguments in Qt5; connecting to these by name only
+# would pick the default overload, so their string-based connections are left as they are.
+OVERLOADED_SIGNALS = {"activated", "currentIndexChanged", "highlighted", "valueChanged"}
+
+
+def fix_signal_connections(path):
+    """Replaces old-style signal connections with new-style ones in a given automatically generated Python ui file.
+    Connections to signals in OVERLOADED_SIGNALS are not touched."""
+    old_style = re.compile(r'QtCore\.QObject\.connect\((.+), QtCore\.SIGNAL\("(\w+)\([^)]*\)"\), (.+)\)$')
+
+    def new_style(match):
+        sender, signal, slot = match.groups()
+        if signal in OVERLOADED_SIGNALS:
+            return match.group(0)
+        return f"{sender}.{signal}.connect({slot})"
+
+    lines = list()
+    with open(path, 'r') as in_file:
+        for line in in_file:
+            lines.append(old_style.sub(new_style, line))
+    with open(path, 'w') as out_file:
+        out_file.writelines(lines)
+
+
 print(
     """<Script for Building Spine Toolbox GUI>
 Copyright (C) <2017-2020>  <Spine project consortium>
@@ -63,6 +88,7 @@ for ui_dir in ui_dirs:
                 os.system("pyside2-uic --from-imports {} -o {}".format(entry.path, output_path))
                 append_license(output_path)
                 fix_resources_imports(output_path)
+                fix_signal_connections(output_path)
                 append_license(entry.path)
 resources_dir = os.path.join(project_source_dir, "ui", "resources")
 for entry in os.scandir(resources_dir):
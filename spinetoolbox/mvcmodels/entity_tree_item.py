@@ -413,7 +413,7 @@ class ObjectClassItem(EntityClassItem):
 
     def _get_children_ids(self, db_map):
         """Returns a set of object ids in this class."""
-        return {x["id"] for x in self.db_mngr.get_items(db_map, "object") if x["class_id"] == self.db_map_id(db_map)}
+        return {x["id"] for x in self.db_mngr.get_items_by_field(db_map, "object", "class_id", self.db_map_id(db_map))}
 
     @property
     def child_item_type(self):
@@ -447,18 +447,15 @@ class RelationshipClassItem(EntityClassItem):
         """Returns a set of relationship ids in this class.
         If the parent is an ObjectItem, then only returns ids of relationships involving that object.
         """
+        class_id = self.db_map_id(db_map)
         if not isinstance(self.parent_item, ObjectItem):
-            return {
-                x["id"]
-                for x in self.db_mngr.get_items(db_map, "relationship")
-                if x["class_id"] == self.db_map_id(db_map)
-            }
+            return {x["id"] for x in self.db_mngr.get_items_by_field(db_map, "relationship", "class_id", class_id)}
         object_id = self.parent_item.db_map_id(db_map)
         return {
             x["id"]
             for items in self.db_mngr.find_cascading_relationships({db_map: {object_id}}).values()
             for x in items
-            if x["class_id"] == self.db_map_id(db_map)
+            if x["class_id"] == class_id
         }
 
     @property
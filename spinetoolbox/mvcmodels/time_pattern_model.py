@@ -23,6 +23,9 @@ from .indexed_value_table_model import IndexedValueTableModel
 
 
 class TimePatternModel(IndexedValueTableModel):
+    _editable_flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+    _edit_roles = [Qt.EditRole]
+
     def __init__(self, value):
         """A model for time pattern type parameter values.
 
@@ -35,7 +38,7 @@ class TimePatternModel(IndexedValueTableModel):
         """Returns flags at index."""
         if not index.isValid():
             return Qt.NoItemFlags
-        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+        return self._editable_flags
 
     def insertRows(self, row, count, parent=QModelIndex()):
         """
@@ -54,12 +57,11 @@ class TimePatternModel(IndexedValueTableModel):
         old_indexes = self._value.indexes
         old_values = self._value.values
         new_indexes = list(old_indexes)
-        for _ in range(count):
-            new_indexes.insert(row, "")
-        if row == len(old_values):
-            new_values = np.append(old_values, np.zeros(count))
-        else:
-            new_values = np.insert(old_values, row, np.zeros(count))
+        new_indexes[row:row] = count * [""]
+        new_values = np.empty(len(old_values) + count, dtype=old_values.dtype)
+        new_values[:row] = old_values[:row]
+        new_values[row : row + count] = 0.0
+        new_values[row + count :] = old_values[row:]
         self._value = TimePattern(new_indexes, new_values)
         self.endInsertRows()
         return True
@@ -76,18 +78,21 @@ class TimePatternModel(IndexedValueTableModel):
         Returns:
             True if the operation was successful
         """
-        if len(self._value) == 1:
+        length = len(self._value)
+        if length == 1:
             return False
-        if count == len(self._value):
-            count = len(self._value) - 1
+        if count == length:
+            # Keep the first time period - value pair
+            count = length - 1
             row = 1
         self.beginRemoveRows(parent, row, row + count - 1)
         old_indexes = self._value.indexes
         old_values = self._value.values
         new_indexes = list(old_indexes)
         del new_indexes[row : row + count]
-        remove_indexes = range(row, row + count) if count > 1 else row
-        new_values = np.delete(old_values, remove_indexes)
+        new_values = np.empty(length - count, dtype=old_values.dtype)
+        new_values[:row] = old_values[:row]
+        new_values[row:] = old_values[row + count :]
         self._value = TimePattern(new_indexes, new_values)
         self.endRemoveRows()
         return True
@@ -103,15 +108,16 @@ class TimePatternModel(IndexedValueTableModel):
             value (str, float): a new time period or value
             role (int): a role
         Returns:
-            True if the operation was successful
+            True if the operation was successful, False if it failed or the value did not change
         """
         if not index.isValid() or role != Qt.EditRole:
             return False
-        if index.column() == 0:
-            self._value.indexes[index.row()] = value
-        else:
-            self._value.values[index.row()] = value
-        self.dataChanged.emit(index, index, [Qt.EditRole])
+        row = index.row()
+        data = self._value.indexes if index.column() == 0 else self._value.values
+        if data[row] == value:
+            return False
+        data[row] = value
+        self.dataChanged.emit(index, index, self._edit_roles)
         return True
 
     def batch_set_data(self, indexes, values):
@@ -135,4 +141,4 @@ class TimePatternModel(IndexedValueTableModel):
                 self._value.values[row] = value
         left_top = self.index(min(modified_rows), min(modified_columns))
         right_bottom = self.index(max(modified_rows), max(modified_columns))
-        self.dataChanged.emit(left_top, right_bottom, [Qt.EditRole])
+        self.dataChanged.emit(left_top, right_bottom, self._edit_roles)
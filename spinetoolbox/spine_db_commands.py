@@ -17,55 +17,60 @@ QUndoCommand subclasses for modifying the db.
 """
 
 import time
-from copy import deepcopy
 from PySide2.QtCore import Slot
 from PySide2.QtWidgets import QUndoCommand, QUndoStack
 
 
 def _cache_to_db_relationship_class(item):
-    item = deepcopy(item)
+    item = dict(item)
     item["object_class_id_list"] = [int(id_) for id_ in item["object_class_id_list"].split(",")]
     del item["object_class_name_list"]
     return item
 
 
 def _cache_to_db_relationship(item):
-    item = deepcopy(item)
+    item = dict(item)
     item["object_id_list"] = [int(id_) for id_ in item["object_id_list"].split(",")]
     del item["object_name_list"]
     return item
 
 
 def _cache_to_db_parameter_definition(item):
-    item = {k: v for k, v in item.items() if k != "formatted_default_value"}
-    item = deepcopy(item)
-    if "parameter_name" in item:
-        item["name"] = item.pop("parameter_name")
-    return item
+    # Values other than the formatted one are atomic, so a single filtering and renaming pass is enough
+    return {
+        ("name" if k == "parameter_name" else k): v for k, v in item.items() if k != "formatted_default_value"
+    }
 
 
 def _cache_to_db_parameter_value(item):
-    item = {k: v for k, v in item.items() if k != "formatted_value"}
-    item = deepcopy(item)
-    if "parameter_id" in item:
-        item["parameter_definition_id"] = item.pop("parameter_id")
-    return item
+    return {
+        ("parameter_definition_id" if k == "parameter_id" else k): v
+        for k, v in item.items()
+        if k != "formatted_value"
+    }
 
 
 def _cache_to_db_parameter_value_list(item):
-    item = deepcopy(item)
+    item = dict(item)
     item["value_list"] = item["value_list"].split(",")
     return item
 
 
+def _identity(item):
+    return item
+
+
+_CACHE_TO_DB_ITEM = {
+    "relationship class": _cache_to_db_relationship_class,
+    "relationship": _cache_to_db_relationship,
+    "parameter definition": _cache_to_db_parameter_definition,
+    "parameter value": _cache_to_db_parameter_value,
+    "parameter value list": _cache_to_db_parameter_value_list,
+}
+
+
 def _cache_to_db_item(item_type, item):
-    return {
-        "relationship class": _cache_to_db_relationship_class,
-        "relationship": _cache_to_db_relationship,
-        "parameter definition": _cache_to_db_parameter_definition,
-        "parameter value": _cache_to_db_parameter_value,
-        "parameter value list": _cache_to_db_parameter_value_list,
-    }.get(item_type, lambda x: x)(item)
+    return _CACHE_TO_DB_ITEM.get(item_type, _identity)(item)
 
 
 def _format_item(item_type, item):
@@ -115,18 +120,33 @@ class CommandBase(QUndoCommand):
 
     @staticmethod
     def redomethod(func):
+        """Wraps a redo method so that the first redo receives the changed items.
+        If receive_signal is None, the wrapped method is expected to pass ``self.callback``
+        to the db manager, which calls it directly instead of going through a signal.
+        """
+
         def redo(self):
             if self._completed:
                 func(self)
                 return
-            self.receive_signal.connect(self.receive_items_changed)
-            func(self)
-            self.receive_signal.disconnect(self.receive_items_changed)
+            if self.receive_signal is not None:
+                self.receive_signal.connect(self.receive_items_changed)
+                func(self)
+                self.receive_signal.disconnect(self.receive_items_changed)
+            else:
+                func(self)
             if not self._completed:
                 self.setObsolete(True)
 
         return redo
 
+    @property
+    def callback(self):
+        """Returns the function the db manager should call with the changed items, or None."""
+        if self._completed or self.receive_signal is not None:
+            return None
+        return self.receive_items_changed
+
     @Slot(object)
     def receive_items_changed(self, db_map_data):
         self._completed = True
@@ -194,17 +214,20 @@ class AddItemsCommand(CommandBase):
         self.item_type = item_type
         self.method_name = self._method_name[item_type]
         self.emit_signal_name = self._emit_signal_name[item_type]
-        receive_signal_name = self._receive_signal_name.get(item_type, self.emit_signal_name)
-        self.receive_signal = getattr(db_mngr, receive_signal_name)
+        receive_signal_name = self._receive_signal_name.get(item_type)
+        if receive_signal_name is not None:
+            self.receive_signal = getattr(db_mngr, receive_signal_name)
         self.setText(self._command_name[item_type] + f" to '{db_map.codename}'")
         self.undo_db_map_data = None
 
     @CommandBase.redomethod
     def redo(self):
-        self.db_mngr.add_or_update_items(self.redo_db_map_data, self.method_name, self.emit_signal_name)
+        self.db_mngr.add_or_update_items(
+            self.redo_db_map_data, self.method_name, self.emit_signal_name, callback=self.callback
+        )
 
     def undo(self):
-        self.db_mngr.do_remove_items(self.undo_db_map_data)
+        self.db_mngr.do_remove_items(self.undo_db_map_data, item_type=self.item_type)
 
     @Slot(object)
     def receive_items_changed(self, db_map_data):
@@ -213,11 +236,11 @@ class AddItemsCommand(CommandBase):
             db_map: [_cache_to_db_item(self.item_type, item) for item in data] for db_map, data in db_map_data.items()
         }
         self.method_name = self._redo_method_name[self.item_type]
-        self.undo_db_map_data = {db_map: {self.item_type: data} for db_map, data in db_map_data.items()}
+        self.undo_db_map_data = db_map_data
         self._completed = True
 
     def data(self):
-        return {_format_item(self.item_type, item): [] for item in self.undo_db_map_data[self.db_map][self.item_type]}
+        return {_format_item(self.item_type, item): [] for item in self.undo_db_map_data[self.db_map]}
 
 
 class AddCheckedParameterValuesCommand(AddItemsCommand):
@@ -271,18 +294,17 @@ class UpdateItemsCommand(CommandBase):
         self.item_type = item_type
         self.method_name = self._method_name[item_type]
         self.emit_signal_name = self._emit_signal_name[item_type]
-        self.receive_signal = getattr(db_mngr, self.emit_signal_name)
         self.setText(self._command_name[item_type] + f" in '{db_map.codename}'")
-        self.undo_db_map_data = {db_map: [self._undo_item(db_map, item["id"]) for item in data]}
+        items = db_mngr.get_items_by_id(db_map, item_type, (item["id"] for item in data))
+        cache_to_db = _CACHE_TO_DB_ITEM.get(item_type, _identity)
+        self.undo_db_map_data = {db_map: [cache_to_db(items[item["id"]]) for item in data]}
         self._completed = False
 
-    def _undo_item(self, db_map, id_):
-        item = self.db_mngr.get_item(db_map, self.item_type, id_)
-        return _cache_to_db_item(self.item_type, item)
-
     @CommandBase.redomethod
     def redo(self):
-        self.db_mngr.add_or_update_items(self.redo_db_map_data, self.method_name, self.emit_signal_name)
+        self.db_mngr.add_or_update_items(
+            self.redo_db_map_data, self.method_name, self.emit_signal_name, callback=self.callback
+        )
 
     def undo(self):
         self.db_mngr.add_or_update_items(self.undo_db_map_data, self.method_name, self.emit_signal_name)
@@ -299,26 +321,9 @@ class UpdateCheckedParameterValuesCommand(UpdateItemsCommand):
 
 class RemoveItemsCommand(CommandBase):
 
-    _undo_method_name = {
-        "object class": "readd_object_classes",
-        "object": "readd_objects",
-        "relationship class": "readd_wide_relationship_classes",
-        "relationship": "readd_wide_relationships",
-        "parameter definition": "readd_parameter_definitions",
-        "parameter value": "readd_parameter_values",
-        "parameter value list": "readd_wide_parameter_value_lists",
-        "parameter tag": "readd_parameter_tags",
-    }
-    _emit_signal_name = {
-        "object class": "object_classes_added",
-        "object": "objects_added",
-        "relationship class": "relationship_classes_added",
-        "relationship": "relationships_added",
-        "parameter definition": "_parameter_definitions_added",
-        "parameter value": "_parameter_values_added",
-        "parameter value list": "parameter_value_lists_added",
-        "parameter tag": "parameter_tags_added",
-    }
+    # Undoing a removal re-adds the items exactly like redoing an addition does
+    _undo_method_name = AddItemsCommand._redo_method_name
+    _emit_signal_name = AddItemsCommand._emit_signal_name
 
     def __init__(self, db_mngr, db_map, typed_data):
         """
@@ -16,6 +16,10 @@ The SpineDBManager class
 :date:   2.10.2019
 """
 
+import sys
+from collections import defaultdict
+from itertools import chain
+from operator import itemgetter, methodcaller
 from PySide2.QtCore import Qt, QObject, Signal, Slot, QSettings
 from PySide2.QtWidgets import QMessageBox, QDialog, QCheckBox
 from PySide2.QtGui import QKeySequence, QIcon, QFontMetrics, QFont
@@ -48,6 +52,66 @@ from .spine_db_commands import (
 from .widgets.manage_db_items_dialog import CommitDialog
 
 
+_asdict = methodcaller("_asdict")
+_QUERY_CHUNK_SIZE = 1000
+
+
+def _query_items(qry):
+    """Returns the rows of the given query as dictionaries.
+    Rows are fetched from the db in chunks and converted as they arrive,
+    so the full list of raw rows is never held in memory.
+
+    Args:
+        qry (Query)
+
+    Returns:
+        list: dictionary items
+    """
+    return list(map(_asdict, qry.yield_per(_QUERY_CHUNK_SIZE)))
+
+
+def _common_entity_type(items, object_key, relationship_key):
+    """Returns 'object class' if all items have a value for object_key,
+    'relationship class' if all have a value for relationship_key, and None otherwise.
+
+    Args:
+        items (list): dictionary items
+        object_key (str)
+        relationship_key (str)
+
+    Returns:
+        str, NoneType
+    """
+    if not items:
+        return None
+    if all(item.get(object_key) for item in items):
+        return "object class"
+    if all(item.get(relationship_key) for item in items):
+        return "relationship class"
+    return None
+
+
+class _HandlerChain:
+    """Calls a sequence of handlers in order with the same arguments.
+    Connecting one of these to a signal, instead of every handler separately,
+    makes the signal go through Qt's slot dispatch only once.
+
+    The handlers run as plain Python calls, so they need no Slot decorators.
+    As with separate connections, an exception in one handler is reported through sys.excepthook
+    and the remaining handlers still run, e.g. a failing cascade doesn't keep items in the cache.
+    """
+
+    def __init__(self, handlers):
+        self._handlers = tuple(handlers)
+
+    def __call__(self, *args):
+        for handler in self._handlers:
+            try:
+                handler(*args)
+            except Exception:  # pylint: disable=broad-except
+                sys.excepthook(*sys.exc_info())
+
+
 @busy_effect
 def do_create_new_spine_database(url, for_spine_model):
     """Creates a new spine database at the given url."""
@@ -99,6 +163,31 @@ class SpineDBManager(QObject):
     items_removed_from_cache = Signal("QVariant")
 
     _GROUP_SEP = " \u01C0 "
+    # Methods that fetch all items of a given type from the db, used by _get_items_from_db
+    _item_getter_names = {
+        "object class": "get_object_classes",
+        "object": "get_objects",
+        "relationship class": "get_relationship_classes",
+        "relationship": "get_relationships",
+        "parameter definition": "get_parameter_definitions",
+        "parameter value": "get_parameter_values",
+        "parameter value list": "get_parameter_value_lists",
+        "parameter tag": "get_parameter_tags",
+    }
+    # Subqueries that _find_items_by_field can filter directly in the db
+    _item_subquery_names = {
+        "parameter definition": ("object_parameter_definition_sq", "relationship_parameter_definition_sq"),
+        "parameter value": ("object_parameter_value_sq", "relationship_parameter_value_sq"),
+    }
+    # Item types whose cache is updated by connect_signals on every add, update and remove
+    _signal_cached_item_types = {
+        "object class",
+        "object",
+        "relationship class",
+        "relationship",
+        "parameter definition",
+        "parameter value",
+    }
 
     def __init__(self, logger, project):
         """Initializes the instance.
@@ -110,7 +199,13 @@ class SpineDBManager(QObject):
         super().__init__(project)
         self._logger = logger
         self._db_maps = {}
-        self._cache = {}
+        self._db_map_set = frozenset()
+        self._cache = defaultdict(dict)
+        self._field_indexes = {}
+        self._fully_fetched = set()
+        self._uncached_during_removal = None
+        self._handler_chains = []
+        self._entity_class_icons = {}
         self.qsettings = QSettings("SpineProject", "Spine Toolbox")
         self.signaller = SpineDBSignaller(self)
         self.undo_stack = {}
@@ -121,7 +216,7 @@ class SpineDBManager(QObject):
 
     @property
     def db_maps(self):
-        return set(self._db_maps.values())
+        return self._db_map_set
 
     def create_new_spine_database(self, url, for_spine_model=False):
         if url in self._db_maps:
@@ -154,6 +249,8 @@ class SpineDBManager(QObject):
         db_map = self._db_maps.pop(url, None)
         if db_map is None:
             return
+        self._db_map_set = frozenset(self._db_maps.values())
+        self._clear_cache(db_map)
         db_map.connection.close()
 
     def close_all_sessions(self):
@@ -212,6 +309,7 @@ class SpineDBManager(QObject):
         """
         if url not in self._db_maps:
             self._db_maps[url] = DiffDatabaseMapping(url, upgrade=upgrade, codename=codename)
+            self._db_map_set = frozenset(self._db_maps.values())
         return self._db_maps[url]
 
     def get_db_map_for_listener(self, listener, url, upgrade=False, codename=None):
@@ -275,6 +373,7 @@ class SpineDBManager(QObject):
                 db_map.rollback_session()
                 rolled_db_maps.add(db_map)
                 self.undo_stack[db_map].clear()
+                self._clear_cache(db_map)
             except SpineDBAPIError as e:
                 error_log[db_map] = e.msg
         if any(error_log.values()):
@@ -296,6 +395,7 @@ class SpineDBManager(QObject):
     def _rollback_db_map_session(self, db_map):
         try:
             db_map.rollback_session()
+            self._clear_cache(db_map)
             return True
         except SpineDBAPIError as e:
             self.msg_error.emit({db_map: e.msg})
@@ -343,75 +443,67 @@ class SpineDBManager(QObject):
         return True
 
     def connect_signals(self):
-        """Connects signals."""
+        """Connects signals.
+
+        The manager's own handlers are chained per signal and connected with a single connection,
+        so each emission goes through Qt's slot dispatch once for the manager and once for the signaller.
+        """
         # Error
         self.msg_error.connect(self.receive_error_msg)
+        handlers = defaultdict(list)
         # Add to cache
-        self.object_classes_added.connect(lambda db_map_data: self.cache_items("object class", db_map_data))
-        self.objects_added.connect(lambda db_map_data: self.cache_items("object", db_map_data))
-        self.relationship_classes_added.connect(lambda db_map_data: self.cache_items("relationship class", db_map_data))
-        self.relationships_added.connect(lambda db_map_data: self.cache_items("relationship", db_map_data))
-        self.parameter_definitions_added.connect(
-            lambda db_map_data: self.cache_items("parameter definition", db_map_data)
-        )
-        self.parameter_values_added.connect(lambda db_map_data: self.cache_items("parameter value", db_map_data))
+        handlers["object_classes_added"].append(self.cache_object_classes)
+        handlers["objects_added"].append(self.cache_objects)
+        handlers["relationship_classes_added"].append(self.cache_relationship_classes)
+        handlers["relationships_added"].append(self.cache_relationships)
+        handlers["parameter_definitions_added"].append(self.cache_parameter_definitions)
+        handlers["parameter_values_added"].append(self.cache_parameter_values)
         # Update in cache
-        self.object_classes_updated.connect(lambda db_map_data: self.cache_items("object class", db_map_data))
-        self.objects_updated.connect(lambda db_map_data: self.cache_items("object", db_map_data))
-        self.relationship_classes_updated.connect(
-            lambda db_map_data: self.cache_items("relationship class", db_map_data)
-        )
-        self.relationships_updated.connect(lambda db_map_data: self.cache_items("relationship", db_map_data))
-        self.parameter_definitions_updated.connect(
-            lambda db_map_data: self.cache_items("parameter definition", db_map_data)
-        )
-        self.parameter_values_updated.connect(lambda db_map_data: self.cache_items("parameter value", db_map_data))
-        self.parameter_definition_tags_set.connect(self.cache_parameter_definition_tags)
+        handlers["object_classes_updated"].append(self.cache_object_classes)
+        handlers["objects_updated"].append(self.cache_objects)
+        handlers["relationship_classes_updated"].append(self.cache_relationship_classes)
+        handlers["relationships_updated"].append(self.cache_relationships)
+        handlers["parameter_definitions_updated"].append(self.cache_parameter_definitions)
+        handlers["parameter_values_updated"].append(self.cache_parameter_values)
+        handlers["parameter_definition_tags_set"].append(self.cache_parameter_definition_tags)
         # Go from compact to extend format
-        self._parameter_definitions_added.connect(self.do_add_parameter_definitions)
-        self._parameter_definitions_updated.connect(self.do_update_parameter_definitions)
-        self._parameter_values_added.connect(self.do_add_parameter_values)
-        self._parameter_values_updated.connect(self.do_update_parameter_values)
+        handlers["_parameter_definitions_added"].append(self.do_add_parameter_definitions)
+        handlers["_parameter_definitions_updated"].append(self.do_update_parameter_definitions)
+        handlers["_parameter_values_added"].append(self.do_add_parameter_values)
+        handlers["_parameter_values_updated"].append(self.do_update_parameter_values)
         # Icons
-        self.object_classes_added.connect(self.update_icons)
-        self.object_classes_updated.connect(self.update_icons)
+        handlers["object_classes_added"].append(self.update_icons)
+        handlers["object_classes_updated"].append(self.update_icons)
+        handlers["relationship_classes_added"].append(self.forget_relationship_class_icons)
+        handlers["relationship_classes_updated"].append(self.forget_relationship_class_icons)
+        handlers["relationship_classes_removed"].append(self.forget_relationship_class_icons)
         # On cascade remove
-        self.object_classes_removed.connect(self.cascade_remove_objects)
-        self.object_classes_removed.connect(self.cascade_remove_relationship_classes)
-        self.object_classes_removed.connect(self.cascade_remove_parameter_definitions)
-        self.object_classes_removed.connect(self.cascade_remove_parameter_values_by_entity_class)
-        self.relationship_classes_removed.connect(self.cascade_remove_relationships_by_class)
-        self.relationship_classes_removed.connect(self.cascade_remove_parameter_definitions)
-        self.relationship_classes_removed.connect(self.cascade_remove_parameter_values_by_entity_class)
-        self.objects_removed.connect(self.cascade_remove_relationships_by_object)
-        self.objects_removed.connect(self.cascade_remove_parameter_values_by_entity)
-        self.relationships_removed.connect(self.cascade_remove_parameter_values_by_entity)
-        self.parameter_definitions_removed.connect(self.cascade_remove_parameter_values_by_definition)
+        handlers["object_classes_removed"].append(self.cascade_on_object_classes_removed)
+        handlers["relationship_classes_removed"].append(self.cascade_on_relationship_classes_removed)
+        handlers["objects_removed"].append(self.cascade_on_objects_removed)
+        handlers["relationships_removed"].append(self.cascade_on_relationships_removed)
+        handlers["parameter_definitions_removed"].append(self.cascade_on_parameter_definitions_removed)
         # On cascade refresh
-        self.object_classes_updated.connect(self.cascade_refresh_relationship_classes)
-        self.object_classes_updated.connect(self.cascade_refresh_parameter_definitions)
-        self.object_classes_updated.connect(self.cascade_refresh_parameter_values_by_entity_class)
-        self.relationship_classes_updated.connect(self.cascade_refresh_parameter_definitions)
-        self.relationship_classes_updated.connect(self.cascade_refresh_parameter_values_by_entity_class)
-        self.objects_updated.connect(self.cascade_refresh_relationships_by_object)
-        self.objects_updated.connect(self.cascade_refresh_parameter_values_by_entity)
-        self.relationships_updated.connect(self.cascade_refresh_parameter_values_by_entity)
-        self.parameter_definitions_updated.connect(self.cascade_refresh_parameter_values_by_definition)
-        self.parameter_value_lists_updated.connect(self.cascade_refresh_parameter_definitions_by_value_list)
-        self.parameter_value_lists_removed.connect(self.cascade_refresh_parameter_definitions_by_value_list)
-        self.parameter_tags_updated.connect(self.cascade_refresh_parameter_definitions_by_tag)
-        self.parameter_tags_removed.connect(self.cascade_refresh_parameter_definitions_by_tag)
+        handlers["object_classes_updated"].append(self.cascade_on_object_classes_updated)
+        handlers["relationship_classes_updated"].append(self.cascade_on_relationship_classes_updated)
+        handlers["objects_updated"].append(self.cascade_on_objects_updated)
+        handlers["relationships_updated"].append(self.cascade_on_relationships_updated)
+        handlers["parameter_definitions_updated"].append(self.cascade_on_parameter_definitions_updated)
+        handlers["parameter_value_lists_updated"].append(self.cascade_on_parameter_value_lists_changed)
+        handlers["parameter_value_lists_removed"].append(self.cascade_on_parameter_value_lists_changed)
+        handlers["parameter_tags_updated"].append(self.cascade_on_parameter_tags_changed)
+        handlers["parameter_tags_removed"].append(self.cascade_on_parameter_tags_changed)
         # Remove from cache (last, because of how cascade removal works at the moment)
-        self.object_classes_removed.connect(lambda db_map_data: self.uncache_items("object class", db_map_data))
-        self.objects_removed.connect(lambda db_map_data: self.uncache_items("object", db_map_data))
-        self.relationship_classes_removed.connect(
-            lambda db_map_data: self.uncache_items("relationship class", db_map_data)
-        )
-        self.relationships_removed.connect(lambda db_map_data: self.uncache_items("relationship", db_map_data))
-        self.parameter_definitions_removed.connect(
-            lambda db_map_data: self.uncache_items("parameter definition", db_map_data)
-        )
-        self.parameter_values_removed.connect(lambda db_map_data: self.uncache_items("parameter value", db_map_data))
+        handlers["object_classes_removed"].append(self.uncache_object_classes)
+        handlers["objects_removed"].append(self.uncache_objects)
+        handlers["relationship_classes_removed"].append(self.uncache_relationship_classes)
+        handlers["relationships_removed"].append(self.uncache_relationships)
+        handlers["parameter_definitions_removed"].append(self.uncache_parameter_definitions)
+        handlers["parameter_values_removed"].append(self.uncache_parameter_values)
+        for signal_name, signal_handlers in handlers.items():
+            handler_chain = _HandlerChain(signal_handlers)
+            self._handler_chains.append(handler_chain)
+            getattr(self, signal_name).connect(handler_chain)
         # Do this last, so cache is ready when listeners receive signals
         self.signaller.connect_signals()
 
@@ -433,8 +525,9 @@ class SpineDBManager(QObject):
             db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
         """
         for db_map, items in db_map_data.items():
-            for item in items:
-                self._cache.setdefault(db_map, {}).setdefault(item_type, {}).update({item["id"]: item})
+            cached_items = self._cache[db_map, item_type]
+            cached_items.update(zip(map(itemgetter("id"), items), items))
+            self._field_indexes.pop((db_map, item_type), None)
 
     def uncache_items(self, item_type, db_map_data):
         """Removes data from cache.
@@ -445,27 +538,138 @@ class SpineDBManager(QObject):
         """
         db_map_typed_data = {}
         for db_map, items in db_map_data.items():
+            cached_items = self._cache.get((db_map, item_type))
+            if not cached_items:
+                continue
+            removed_items = []
             for item in items:
-                if db_map not in self._cache:
-                    continue
-                cached_map = self._cache[db_map]
-                if item_type not in cached_map:
-                    continue
-                cached_items = cached_map[item_type]
-                item_id = item["id"]
-                if item_id in cached_items:
-                    item = cached_items.pop(item_id)
-                    db_map_typed_data.setdefault(db_map, {}).setdefault(item_type, []).append(item)
+                item = cached_items.pop(item["id"], None)
+                if item is not None:
+                    removed_items.append(item)
+            if removed_items:
+                db_map_typed_data[db_map] = {item_type: removed_items}
+                self._field_indexes.pop((db_map, item_type), None)
+        if self._uncached_during_removal is not None:
+            # do_remove_items emits everything in one go when the cascade is over
+            self._uncached_during_removal.append(db_map_typed_data)
+            return
         self.items_removed_from_cache.emit(db_map_typed_data)
 
+    def cache_object_classes(self, db_map_data):
+        """Caches object classes.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.cache_items("object class", db_map_data)
+
+    def cache_objects(self, db_map_data):
+        """Caches objects.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.cache_items("object", db_map_data)
+
+    def cache_relationship_classes(self, db_map_data):
+        """Caches relationship classes.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.cache_items("relationship class", db_map_data)
+
+    def cache_relationships(self, db_map_data):
+        """Caches relationships.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.cache_items("relationship", db_map_data)
+
+    def cache_parameter_definitions(self, db_map_data):
+        """Caches parameter definitions.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.cache_items("parameter definition", db_map_data)
+
+    def cache_parameter_values(self, db_map_data):
+        """Caches parameter values.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.cache_items("parameter value", db_map_data)
+
+    def uncache_object_classes(self, db_map_data):
+        """Removes object classes from cache.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.uncache_items("object class", db_map_data)
+
+    def uncache_objects(self, db_map_data):
+        """Removes objects from cache.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.uncache_items("object", db_map_data)
+
+    def uncache_relationship_classes(self, db_map_data):
+        """Removes relationship classes from cache.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.uncache_items("relationship class", db_map_data)
+
+    def uncache_relationships(self, db_map_data):
+        """Removes relationships from cache.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.uncache_items("relationship", db_map_data)
+
+    def uncache_parameter_definitions(self, db_map_data):
+        """Removes parameter definitions from cache.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.uncache_items("parameter definition", db_map_data)
+
+    def uncache_parameter_values(self, db_map_data):
+        """Removes parameter values from cache.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        self.uncache_items("parameter value", db_map_data)
+
     def update_icons(self, db_map_data):
         """Runs when object classes are added or updated. Setups icons for those classes.
         Args:
             item_type (str)
             db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
         """
-        object_classes = [item for db_map, data in db_map_data.items() for item in data]
-        self.icon_mngr.setup_object_pixmaps(object_classes)
+        self.icon_mngr.setup_object_pixmaps(chain.from_iterable(db_map_data.values()))
+        # Relationship class icons are made of object class icons, so all memorized icons are potentially obsolete
+        self._entity_class_icons.clear()
+
+    def forget_relationship_class_icons(self, db_map_data):
+        """Runs when relationship classes are added, updated or removed. Drops their memorized icons.
+
+        Args:
+            db_map_data (dict): lists of dictionary items keyed by DiffDatabaseMapping
+        """
+        for db_map, data in db_map_data.items():
+            for item in data:
+                self._entity_class_icons.pop((db_map, "relationship class", item["id"]), None)
 
     def entity_class_icon(self, db_map, entity_type, entity_class_id):
         """Returns an appropriate icon for a given entity class.
@@ -478,13 +682,21 @@ class SpineDBManager(QObject):
         Returns:
             QIcon
         """
+        key = (db_map, entity_type, entity_class_id)
+        icon = self._entity_class_icons.get(key)
+        if icon is not None:
+            return icon
         entity_class = self.get_item(db_map, entity_type, entity_class_id)
         if not entity_class:
             return None
         if entity_type == "object class":
-            return self.icon_mngr.object_icon(entity_class["name"])
-        if entity_type == "relationship class":
-            return self.icon_mngr.relationship_icon(entity_class["object_class_name_list"])
+            icon = self.icon_mngr.object_icon(entity_class["name"])
+        elif entity_type == "relationship class":
+            icon = self.icon_mngr.relationship_icon(entity_class["object_class_name_list"])
+        else:
+            return None
+        self._entity_class_icons[key] = icon
+        return icon
 
     def get_item(self, db_map, item_type, id_):
         """Returns the item of the given type in the given db map that has the given id,
@@ -498,11 +710,30 @@ class SpineDBManager(QObject):
         Returns:
             dict
         """
-        item = self._cache.get(db_map, {}).get(item_type, {}).get(id_)
-        if item:
-            return item
+        item = self._cache.get((db_map, item_type), {}).get(id_)
+        if item or (db_map, item_type) in self._fully_fetched:
+            return item or {}
         _ = self._get_items_from_db(db_map, item_type)
-        return self._cache.get(db_map, {}).get(item_type, {}).get(id_, {})
+        return self._cache.get((db_map, item_type), {}).get(id_, {})
+
+    def get_items_by_id(self, db_map, item_type, ids):
+        """Returns the items of the given type in the given db map that have the given ids,
+        keyed by id. Ids that are not found map to an empty dict.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+            item_type (str)
+            ids (Iterable): item ids
+
+        Returns:
+            dict
+        """
+        ids = set(ids)
+        items = self._cache.get((db_map, item_type), {})
+        if not ids.issubset(items) and (db_map, item_type) not in self._fully_fetched:
+            _ = self._get_items_from_db(db_map, item_type)
+            items = self._cache.get((db_map, item_type), {})
+        return {id_: items.get(id_, {}) for id_ in ids}
 
     def get_item_by_field(self, db_map, item_type, field, value):
         """Returns the first item of the given type in the given db map
@@ -533,11 +764,121 @@ class SpineDBManager(QObject):
         Returns:
             list
         """
-        items = [x for x in self.get_items(db_map, item_type) if x.get(field) == value]
+        items = self._get_field_index(db_map, item_type, field).get(value)
         if items:
-            return items
+            return list(items)
+        if (db_map, item_type) in self._fully_fetched:
+            return []
         return [x for x in self._get_items_from_db(db_map, item_type) if x.get(field) == value]
 
+    def _get_field_index(self, db_map, item_type, field):
+        """Returns cached items of the given type in the given db map grouped by the value of the given field.
+        The index is built on first request and dropped whenever items of that type are cached or uncached.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+            item_type (str)
+            field (str)
+
+        Returns:
+            dict: lists of items keyed by field value
+        """
+        field_indexes = self._field_indexes.get((db_map, item_type))
+        if field_indexes is not None and field in field_indexes:
+            return field_indexes[field]
+        items = self.get_items(db_map, item_type)
+        index = {}
+        for item in items:
+            index.setdefault(item.get(field), []).append(item)
+        self._field_indexes.setdefault((db_map, item_type), {})[field] = index
+        return index
+
+    def _find_items_by_field(self, db_map, item_type, field, values):
+        """Returns all items of the given type in the given db map whose value for the given field
+        is one of the given values.
+
+        If nothing of that type has been cached yet, parameter definitions and values are queried
+        with the filter applied in the db, instead of fetching the whole table into the cache.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+            item_type (str)
+            field (str)
+            values (Iterable)
+
+        Returns:
+            list
+        """
+        key = (db_map, item_type)
+        if item_type in self._item_subquery_names and not self._cache.get(key) and key not in self._fully_fetched:
+            return self._query_items_by_field(db_map, item_type, field, values)
+        index = self._get_field_index(db_map, item_type, field)
+        return [item for value in values for item in index.get(value, ())]
+
+    def _query_items_by_field(self, db_map, item_type, field, values):
+        """Returns items of the given type from the given db map whose value for the given field
+        is one of the given values. The items are not cached.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+            item_type (str)
+            field (str)
+            values (Iterable)
+
+        Returns:
+            list: dictionary items
+        """
+        values = set(values)
+        items = []
+        if not values:
+            return items
+        for subquery_name in self._item_subquery_names[item_type]:
+            sq = getattr(db_map, subquery_name)
+            if field not in sq.c:
+                continue
+            items += _query_items(db_map.query(sq).filter(sq.c[field].in_(values)))
+        return items
+
+    def _get_id_list_field_index(self, db_map, item_type, field):
+        """Returns cached items of the given type in the given db map grouped by each of the ids
+        in the given comma separated id list field. An empty list counts as id 0.
+        The index lives and dies together with the ones from _get_field_index.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+            item_type (str)
+            field (str)
+
+        Returns:
+            dict: lists of items keyed by integer id
+        """
+        key = (field, int)
+        field_indexes = self._field_indexes.get((db_map, item_type))
+        if field_indexes is not None and key in field_indexes:
+            return field_indexes[key]
+        index = {}
+        for item in self.get_items(db_map, item_type):
+            for id_ in set(map(int, (item[field] or "0").split(","))):
+                index.setdefault(id_, []).append(item)
+        self._field_indexes.setdefault((db_map, item_type), {})[key] = index
+        return index
+
+    def _find_items_by_id_list_field(self, db_map, item_type, field, ids):
+        """Returns all items of the given type in the given db map whose comma separated id list field
+        contains any of the given ids.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+            item_type (str)
+            field (str)
+            ids (Iterable): integer ids
+
+        Returns:
+            list
+        """
+        index = self._get_id_list_field_index(db_map, item_type, field)
+        return list({item["id"]: item for id_ in ids for item in index.get(id_, ())}.values())
+
     def get_items(self, db_map, item_type):
         """Returns all the items of the given type in the given db map,
         or an empty list if none found.
@@ -549,29 +890,55 @@ class SpineDBManager(QObject):
         Returns:
             list
         """
-        items = self._cache.get(db_map, {}).get(item_type, {})
-        if items:
-            return items.values()
+        items = self._cache.get((db_map, item_type))
+        if items or (db_map, item_type) in self._fully_fetched:
+            return items.values() if items else []
         return self._get_items_from_db(db_map, item_type)
 
     def _get_items_from_db(self, db_map, item_type):
         """Returns all items of the given type in the given db map.
         Called by the above methods whenever they don't find what they're looking for in cache.
         """
-        method_name_dict = {
-            "object class": "get_object_classes",
-            "object": "get_objects",
-            "relationship class": "get_relationship_classes",
-            "relationship": "get_relationships",
-            "parameter definition": "get_parameter_definitions",
-            "parameter value": "get_parameter_values",
-            "parameter value list": "get_parameter_value_lists",
-            "parameter tag": "get_parameter_tags",
-        }
-        method_name = method_name_dict.get(item_type)
-        if not method_name:
+        getter_name = self._item_getter_names.get(item_type)
+        if getter_name is None:
             return []
-        return getattr(self, method_name)(db_map)
+        items = getattr(self, getter_name)(db_map)
+        if item_type in self._signal_cached_item_types:
+            # From now on, the cache holds all items of this type, and it's kept up to date by the signals
+            self._fully_fetched.add((db_map, item_type))
+        return items
+
+    def _forget_fully_fetched(self, db_map):
+        """Makes cache misses in the given db map fall back to the database again.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+        """
+        self._fully_fetched = {key for key in self._fully_fetched if key[0] is not db_map}
+
+    def _clear_cache(self, db_map):
+        """Drops everything cached for the given db map, so it's fetched again from the database when needed.
+
+        Args:
+            db_map (DiffDatabaseMapping)
+        """
+        for key in [key for key in self._cache if key[0] is db_map]:
+            del self._cache[key]
+        for key in [key for key in self._field_indexes if key[0] is db_map]:
+            del self._field_indexes[key]
+        for key in [key for key in self._entity_class_icons if key[0] is db_map]:
+            del self._entity_class_icons[key]
+        self._forget_fully_fetched(db_map)
+
+    def refresh_session(self, *db_maps):
+        """Drops everything cached for the given db maps.
+        Needed whenever the database changes without going through this manager, e.g. after importing data.
+
+        Args:
+            *db_maps: DiffDatabaseMapping instances
+        """
+        for db_map in db_maps:
+            self._clear_cache(db_map)
 
     def get_value(self, db_map, item_type, id_, field, role=Qt.DisplayRole):
         """Returns the value or default value of a parameter.
@@ -640,7 +1007,7 @@ class SpineDBManager(QObject):
             list: dictionary items
         """
         qry = db_map.query(db_map.object_class_sq)
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("object class", {db_map: items})
         self.update_icons({db_map: items})
         return items
@@ -658,7 +1025,7 @@ class SpineDBManager(QObject):
         qry = db_map.query(db_map.object_sq)
         if class_id:
             qry = qry.filter_by(class_id=class_id)
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("object", {db_map: items})
         return items
 
@@ -677,9 +1044,10 @@ class SpineDBManager(QObject):
         if ids:
             qry = qry.filter(db_map.wide_relationship_class_sq.c.id.in_(ids))
         if object_class_id:
-            ids = {x.id for x in db_map.query(db_map.relationship_class_sq).filter_by(object_class_id=object_class_id)}
-            qry = qry.filter(db_map.wide_relationship_class_sq.c.id.in_(ids))
-        items = [x._asdict() for x in qry]
+            sq = db_map.relationship_class_sq
+            class_ids = db_map.query(sq.c.id).filter(sq.c.object_class_id == object_class_id).subquery()
+            qry = qry.filter(db_map.wide_relationship_class_sq.c.id.in_(class_ids))
+        items = _query_items(qry)
         _ = cache and self.cache_items("relationship class", {db_map: items})
         return items
 
@@ -699,11 +1067,12 @@ class SpineDBManager(QObject):
         if ids:
             qry = qry.filter(db_map.wide_relationship_sq.c.id.in_(ids))
         if object_id:
-            ids = {x.id for x in db_map.query(db_map.relationship_sq).filter_by(object_id=object_id)}
-            qry = qry.filter(db_map.wide_relationship_sq.c.id.in_(ids))
+            sq = db_map.relationship_sq
+            relationship_ids = db_map.query(sq.c.id).filter(sq.c.object_id == object_id).subquery()
+            qry = qry.filter(db_map.wide_relationship_sq.c.id.in_(relationship_ids))
         if class_id:
             qry = qry.filter_by(class_id=class_id)
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("relationship", {db_map: items})
         return items
 
@@ -724,7 +1093,7 @@ class SpineDBManager(QObject):
             qry = qry.filter_by(object_class_id=object_class_id)
         if ids:
             qry = qry.filter(sq.c.id.in_(ids))
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("parameter definition", {db_map: items})
         return items
 
@@ -745,7 +1114,7 @@ class SpineDBManager(QObject):
             qry = qry.filter_by(relationship_class_id=relationship_class_id)
         if ids:
             qry = qry.filter(sq.c.id.in_(ids))
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("parameter definition", {db_map: items})
         return items
 
@@ -766,7 +1135,7 @@ class SpineDBManager(QObject):
             qry = qry.filter_by(object_class_id=object_class_id)
         if ids:
             qry = qry.filter(sq.c.id.in_(ids))
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("parameter value", {db_map: items})
         return items
 
@@ -787,41 +1156,65 @@ class SpineDBManager(QObject):
             qry = qry.filter_by(relationship_class_id=relationship_class_id)
         if ids:
             qry = qry.filter(sq.c.id.in_(ids))
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("parameter value", {db_map: items})
         return items
 
-    def get_parameter_definitions(self, db_map, ids=None, entity_class_id=None, cache=True):
+    def get_parameter_definitions(self, db_map, ids=None, entity_class_id=None, entity_type=None, cache=True):
         """Returns both object and relationship parameter definitions.
 
         Args:
             db_map (DiffDatabaseMapping)
             ids (set, optional)
             entity_class_id (int, optional)
+            entity_type (str, optional): either 'object class' or 'relationship class';
+                if given, only definitions for that type of entity class are queried
 
         Returns:
             list: dictionary items
         """
-        return self.get_object_parameter_definitions(
-            db_map, ids=ids, object_class_id=entity_class_id, cache=cache
-        ) + self.get_relationship_parameter_definitions(
-            db_map, ids=ids, relationship_class_id=entity_class_id, cache=cache
-        )
+        items = []
+        if entity_type != "relationship class":
+            items += self.get_object_parameter_definitions(
+                db_map, ids=ids, object_class_id=entity_class_id, cache=cache
+            )
+        if entity_type != "object class":
+            items += self.get_relationship_parameter_definitions(
+                db_map, ids=ids, relationship_class_id=entity_class_id, cache=cache
+            )
+        return items
 
-    def get_parameter_values(self, db_map, ids=None, entity_class_id=None, cache=True):
+    def get_parameter_values(self, db_map, ids=None, entity_class_id=None, entity_type=None, cache=True):
         """Returns both object and relationship parameter values.
 
         Args:
             db_map (DiffDatabaseMapping)
             ids (set, optional)
             entity_class_id (int, optional)
+            entity_type (str, optional): either 'object class' or 'relationship class';
+                if given, only values for that type of entity class are queried
 
         Returns:
             list: dictionary items
         """
-        return self.get_object_parameter_values(
-            db_map, ids=ids, object_class_id=entity_class_id, cache=cache
-        ) + self.get_relationship_parameter_values(db_map, ids=ids, relationship_class_id=entity_class_id, cache=cache)
+        items = []
+        if entity_type != "relationship class":
+            items += self.get_object_parameter_values(db_map, ids=ids, object_class_id=entity_class_id, cache=cache)
+        if entity_type != "object class":
+            items += self.get_relationship_parameter_values(
+                db_map, ids=ids, relationship_class_id=entity_class_id, cache=cache
+            )
+        return items
+
+    @staticmethod
+    def _parameter_definition_entity_type(items):
+        """Returns the type of entity class all given parameter definitions belong to, or None if mixed or unknown."""
+        return _common_entity_type(items, "object_class_id", "relationship_class_id")
+
+    @staticmethod
+    def _parameter_value_entity_type(items):
+        """Returns the type of entity class all given parameter values belong to, or None if mixed or unknown."""
+        return _common_entity_type(items, "object_id", "relationship_id")
 
     def get_parameter_value_lists(self, db_map, cache=True):
         """Returns parameter value lists from database.
@@ -833,7 +1226,7 @@ class SpineDBManager(QObject):
             list: dictionary items
         """
         qry = db_map.query(db_map.wide_parameter_value_list_sq)
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("parameter value list", {db_map: items})
         return items
 
@@ -847,30 +1240,34 @@ class SpineDBManager(QObject):
             list: dictionary items
         """
         qry = db_map.query(db_map.parameter_tag_sq)
-        items = [x._asdict() for x in qry]
+        items = _query_items(qry)
         _ = cache and self.cache_items("parameter tag", {db_map: items})
         return items
 
     @busy_effect
-    def add_or_update_items(self, db_map_data, method_name, signal_name):
+    def add_or_update_items(self, db_map_data, method_name, signal_name, callback=None):
         """Adds or updates items in db.
 
         Args:
             db_map_data (dict): lists of items to add or update keyed by DiffDatabaseMapping
             method_name (str): attribute of DiffDatabaseMapping to call for performing the operation
             signal_name (str) : signal attribute of SpineDBManager to emit if successful
+            callback (Callable, optional): called with the same data as the signal, after emitting it
         """
         db_map_data_out = dict()
         error_log = dict()
         for db_map, items in db_map_data.items():
             items, error_log[db_map] = getattr(db_map, method_name)(*items)
-            if not items.count():
+            items = list(map(_asdict, items))
+            if not items:
                 continue
-            db_map_data_out[db_map] = [x._asdict() for x in items]
+            db_map_data_out[db_map] = items
         if any(error_log.values()):
             self.msg_error.emit(error_log)
         if any(db_map_data_out.values()):
             getattr(self, signal_name).emit(db_map_data_out)
+            if callback is not None:
+                callback(db_map_data_out)
 
     def add_object_classes(self, db_map_data):
         """Adds object classes to db.
@@ -1047,11 +1444,13 @@ class SpineDBManager(QObject):
             self.undo_stack[db_map].push(RemoveItemsCommand(self, db_map, typed_data))
 
     @busy_effect
-    def do_remove_items(self, db_map_typed_data):
+    def do_remove_items(self, db_map_typed_data, item_type=None):
         """Removes items from database.
 
         Args:
             db_map_typed_data (dict): lists of items to remove, keyed by item type (str), keyed by DiffDatabaseMapping
+            item_type (str, optional): if given, db_map_typed_data holds lists of items of this type
+                keyed by DiffDatabaseMapping, without the item type level
         """
         # Removing works this way in spinedb_api, all at once, probably because of cascading?
         db_map_object_classes = dict()
@@ -1063,7 +1462,11 @@ class SpineDBManager(QObject):
         db_map_parameter_value_lists = dict()
         db_map_parameter_tags = dict()
         error_log = dict()
+        removed_item_types = set()
+        get_id = itemgetter("id")
         for db_map, items_per_type in db_map_typed_data.items():
+            if item_type is not None:
+                items_per_type = {item_type: items_per_type}
             object_classes = items_per_type.get("object class", ())
             objects = items_per_type.get("object", ())
             relationship_classes = items_per_type.get("relationship class", ())
@@ -1074,14 +1477,14 @@ class SpineDBManager(QObject):
             parameter_tags = items_per_type.get("parameter tag", ())
             try:
                 db_map.remove_items(
-                    object_class_ids={x['id'] for x in object_classes},
-                    object_ids={x['id'] for x in objects},
-                    relationship_class_ids={x['id'] for x in relationship_classes},
-                    relationship_ids={x['id'] for x in relationships},
-                    parameter_definition_ids={x['id'] for x in parameter_definitions},
-                    parameter_value_ids={x['id'] for x in parameter_values},
-                    parameter_value_list_ids={x['id'] for x in parameter_value_lists},
-                    parameter_tag_ids={x['id'] for x in parameter_tags},
+                    object_class_ids=set(map(get_id, object_classes)),
+                    object_ids=set(map(get_id, objects)),
+                    relationship_class_ids=set(map(get_id, relationship_classes)),
+                    relationship_ids=set(map(get_id, relationships)),
+                    parameter_definition_ids=set(map(get_id, parameter_definitions)),
+                    parameter_value_ids=set(map(get_id, parameter_values)),
+                    parameter_value_list_ids=set(map(get_id, parameter_value_lists)),
+                    parameter_tag_ids=set(map(get_id, parameter_tags)),
                 )
             except SpineDBAPIError as err:
                 error_log[db_map] = err
@@ -1094,126 +1497,261 @@ class SpineDBManager(QObject):
             db_map_parameter_values[db_map] = parameter_values
             db_map_parameter_value_lists[db_map] = parameter_value_lists
             db_map_parameter_tags[db_map] = parameter_tags
-        if any(error_log.values()):
+            removed_item_types.update(type_ for type_, items in items_per_type.items() if items)
+        if error_log:
             self.msg_error.emit(error_log)
-        if any(db_map_object_classes.values()):
-            self.object_classes_removed.emit(db_map_object_classes)
-        if any(db_map_objects.values()):
-            self.objects_removed.emit(db_map_objects)
-        if any(db_map_relationship_classes.values()):
-            self.relationship_classes_removed.emit(db_map_relationship_classes)
-        if any(db_map_relationships.values()):
-            self.relationships_removed.emit(db_map_relationships)
-        if any(db_map_parameter_definitions.values()):
-            self.parameter_definitions_removed.emit(db_map_parameter_definitions)
-        if any(db_map_parameter_values.values()):
-            self.parameter_values_removed.emit(db_map_parameter_values)
-        if any(db_map_parameter_value_lists.values()):
-            self.parameter_value_lists_removed.emit(db_map_parameter_value_lists)
-        if any(db_map_parameter_tags.values()):
-            self.parameter_tags_removed.emit(db_map_parameter_tags)
+        self._uncached_during_removal = []
+        try:
+            if "object class" in removed_item_types:
+                self.object_classes_removed.emit(db_map_object_classes)
+            if "object" in removed_item_types:
+                self.objects_removed.emit(db_map_objects)
+            if "relationship class" in removed_item_types:
+                self.relationship_classes_removed.emit(db_map_relationship_classes)
+            if "relationship" in removed_item_types:
+                self.relationships_removed.emit(db_map_relationships)
+            if "parameter definition" in removed_item_types:
+                self.parameter_definitions_removed.emit(db_map_parameter_definitions)
+            if "parameter value" in removed_item_types:
+                self.parameter_values_removed.emit(db_map_parameter_values)
+            if "parameter value list" in removed_item_types:
+                self.parameter_value_lists_removed.emit(db_map_parameter_value_lists)
+            if "parameter tag" in removed_item_types:
+                self.parameter_tags_removed.emit(db_map_parameter_tags)
+        finally:
+            uncached = self._uncached_during_removal
+            self._uncached_during_removal = None
+        if uncached:
+            self.items_removed_from_cache.emit(self._merge_typed_data(uncached))
+
+    @staticmethod
+    def _merge_typed_data(db_map_typed_data_list):
+        """Merges several dictionaries of typed data into one, preserving the order in which item types appear.
+
+        Args:
+            db_map_typed_data_list (list): dictionaries of item lists keyed by item type, keyed by DiffDatabaseMapping
+
+        Returns:
+            dict: lists of items keyed by item type, keyed by DiffDatabaseMapping
+        """
+        merged = {}
+        for db_map_typed_data in db_map_typed_data_list:
+            for db_map, typed_data in db_map_typed_data.items():
+                merged_typed_data = merged.setdefault(db_map, {})
+                for item_type, items in typed_data.items():
+                    merged_typed_data.setdefault(item_type, []).extend(items)
+        return merged
 
     @staticmethod
     def _to_ids(db_map_data):
-        return {db_map: {x["id"] for x in data} for db_map, data in db_map_data.items()}
+        get_id = itemgetter("id")
+        return {db_map: set(map(get_id, data)) for db_map, data in db_map_data.items()}
 
-    @Slot("QVariant", name="cascade_remove_objects")
-    def cascade_remove_objects(self, db_map_data):
-        """Removes objects in cascade when removing object classes.
+    def cascade_on_object_classes_removed(self, db_map_data):
+        """Removes objects, relationship classes, parameter definitions and parameter values
+        in cascade when removing object classes.
+
+        Args:
+            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+        """
+        db_map_ids = self._to_ids(db_map_data)
+        self.cascade_remove_objects(db_map_ids)
+        self.cascade_remove_relationship_classes(db_map_ids)
+        self.cascade_remove_parameter_definitions(db_map_ids)
+        self.cascade_remove_parameter_values_by_entity_class(db_map_ids)
+
+    def cascade_on_relationship_classes_removed(self, db_map_data):
+        """Removes relationships, parameter definitions and parameter values
+        in cascade when removing relationship classes.
+
+        Args:
+            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+        """
+        db_map_ids = self._to_ids(db_map_data)
+        self.cascade_remove_relationships_by_class(db_map_ids)
+        self.cascade_remove_parameter_definitions(db_map_ids)
+        self.cascade_remove_parameter_values_by_entity_class(db_map_ids)
+
+    def cascade_on_objects_removed(self, db_map_data):
+        """Removes relationships and parameter values in cascade when removing objects.
+
+        Args:
+            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+        """
+        db_map_ids = self._to_ids(db_map_data)
+        self.cascade_remove_relationships_by_object(db_map_ids)
+        self.cascade_remove_parameter_values_by_entity(db_map_ids)
+
+    def cascade_on_relationships_removed(self, db_map_data):
+        """Removes parameter values in cascade when removing relationships.
+
+        Args:
+            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+        """
+        self.cascade_remove_parameter_values_by_entity(self._to_ids(db_map_data))
+
+    def cascade_on_parameter_definitions_removed(self, db_map_data):
+        """Removes parameter values in cascade when removing parameter definitions.
 
         Args:
             db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_entities(self._to_ids(db_map_data), "object")
-        if any(db_map_cascading_data.values()):
+        self.cascade_remove_parameter_values_by_definition(self._to_ids(db_map_data))
+
+    def cascade_on_object_classes_updated(self, db_map_data):
+        """Refreshes cached relationship classes and parameter data in cascade when updating object classes.
+
+        Args:
+            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+        """
+        db_map_ids = self._to_ids(db_map_data)
+        self.cascade_refresh_relationship_classes(db_map_ids)
+        self.cascade_refresh_parameter_definitions(db_map_ids)
+        self.cascade_refresh_parameter_values_by_entity_class(db_map_ids)
+
+    def cascade_on_relationship_classes_updated(self, db_map_data):
+        """Refreshes cached parameter data in cascade when updating relationship classes.
+
+        Args:
+            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+        """
+        db_map_ids = self._to_ids(db_map_data)
+        self.cascade_refresh_parameter_definitions(db_map_ids)
+        self.cascade_refresh_parameter_values_by_entity_class(db_map_ids)
+
+    def cascade_on_objects_updated(self, db_map_data):
+        """Refreshes cached relationships and parameter values in cascade when updating objects.
+
+        Args:
+            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+        """
+        db_map_ids = self._to_ids(db_map_data)
+        self.cascade_refresh_relationships_by_object(db_map_ids)
+        self.cascade_refresh_parameter_values_by_entity(db_map_ids)
+
+    def cascade_on_relationships_updated(self, db_map_data):
+        """Refreshes cached parameter values in cascade when updating relationships.
+
+        Args:
+            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+        """
+        self.cascade_refresh_parameter_values_by_entity(self._to_ids(db_map_data))
+
+    def cascade_on_parameter_definitions_updated(self, db_map_data):
+        """Refreshes cached parameter values in cascade when updating parameter definitions.
+
+        Args:
+            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+        """
+        self.cascade_refresh_parameter_values_by_definition(self._to_ids(db_map_data))
+
+    def cascade_on_parameter_value_lists_changed(self, db_map_data):
+        """Refreshes cached parameter definitions in cascade when updating or removing parameter value lists.
+
+        Args:
+            db_map_data (dict): lists of updated or removed items keyed by DiffDatabaseMapping
+        """
+        self.cascade_refresh_parameter_definitions_by_value_list(self._to_ids(db_map_data))
+
+    def cascade_on_parameter_tags_changed(self, db_map_data):
+        """Refreshes cached parameter definitions in cascade when updating or removing parameter tags.
+
+        Args:
+            db_map_data (dict): lists of updated or removed items keyed by DiffDatabaseMapping
+        """
+        self.cascade_refresh_parameter_definitions_by_tag(self._to_ids(db_map_data))
+
+    def cascade_remove_objects(self, db_map_ids):
+        """Removes objects in cascade when removing object classes.
+
+        Args:
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
+        """
+        db_map_cascading_data = self.find_cascading_entities(db_map_ids, "object")
+        if db_map_cascading_data:
             self.objects_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_remove_relationship_classes")
-    def cascade_remove_relationship_classes(self, db_map_data):
+    def cascade_remove_relationship_classes(self, db_map_ids):
         """Removes relationship classes in cascade when removing object classes.
 
         Args:
-            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_relationship_classes(self._to_ids(db_map_data))
-        if any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_relationship_classes(db_map_ids)
+        if db_map_cascading_data:
             self.relationship_classes_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_remove_relationships_by_class")
-    def cascade_remove_relationships_by_class(self, db_map_data):
+    def cascade_remove_relationships_by_class(self, db_map_ids):
         """Removes relationships in cascade when removing objects.
 
         Args:
-            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_entities(self._to_ids(db_map_data), "relationship")
-        if any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_entities(db_map_ids, "relationship")
+        if db_map_cascading_data:
             self.relationships_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_remove_relationships_by_object")
-    def cascade_remove_relationships_by_object(self, db_map_data):
+    def cascade_remove_relationships_by_object(self, db_map_ids):
         """Removes relationships in cascade when removing relationship classes.
 
         Args:
-            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_relationships(self._to_ids(db_map_data))
-        if any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_relationships(db_map_ids)
+        if db_map_cascading_data:
             self.relationships_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_remove_parameter_definitions")
-    def cascade_remove_parameter_definitions(self, db_map_data):
+    def cascade_remove_parameter_definitions(self, db_map_ids):
         """Removes parameter definitions in cascade when removing entity classes.
 
         Args:
-            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_data(self._to_ids(db_map_data), "parameter definition")
-        if any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_parameter_data(db_map_ids, "parameter definition")
+        if db_map_cascading_data:
             self.parameter_definitions_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_remove_parameter_values_by_entity_class")
-    def cascade_remove_parameter_values_by_entity_class(self, db_map_data):
+    def cascade_remove_parameter_values_by_entity_class(self, db_map_ids):
         """Removes parameter values in cascade when removing entity classes.
 
+        The parameter definitions cascade only reaches values through definitions that are in the cache,
+        and by now the removed rows are gone from the db, so cached values are looked up directly as well.
+
         Args:
-            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_data(self._to_ids(db_map_data), "parameter value")
-        if any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_parameter_data(db_map_ids, "parameter value")
+        if db_map_cascading_data:
             self.parameter_values_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_remove_parameter_values_by_entity")
-    def cascade_remove_parameter_values_by_entity(self, db_map_data):
+    def cascade_remove_parameter_values_by_entity(self, db_map_ids):
         """Removes parameter values in cascade when removing entity classes when removing entities.
 
         Args:
-            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_values_by_entity(self._to_ids(db_map_data))
-        if any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_parameter_values_by_entity(db_map_ids)
+        if db_map_cascading_data:
             self.parameter_values_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_remove_parameter_values_by_definition")
-    def cascade_remove_parameter_values_by_definition(self, db_map_data):
+    def cascade_remove_parameter_values_by_definition(self, db_map_ids):
         """Removes parameter values in cascade when when removing parameter definitions.
 
         Args:
-            db_map_data (dict): lists of removed items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of removed ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_values_by_definition(self._to_ids(db_map_data))
-        if any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_parameter_values_by_definition(db_map_ids)
+        if db_map_cascading_data:
             self.parameter_values_removed.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_relationship_classes")
-    def cascade_refresh_relationship_classes(self, db_map_data):
+    def cascade_refresh_relationship_classes(self, db_map_ids):
         """Refreshes cached relationship classes when updating object classes.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_relationship_classes(self._to_ids(db_map_data))
-        if not any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_relationship_classes(db_map_ids)
+        if not db_map_cascading_data:
             return
         db_map_cascading_data = {
             db_map: self.get_relationship_classes(db_map, ids={x["id"] for x in data}, cache=False)
@@ -1221,15 +1759,14 @@ class SpineDBManager(QObject):
         }
         self.relationship_classes_updated.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_relationships_by_object")
-    def cascade_refresh_relationships_by_object(self, db_map_data):
+    def cascade_refresh_relationships_by_object(self, db_map_ids):
         """Refreshed cached relationships in cascade when updating objects.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_relationships(self._to_ids(db_map_data))
-        if not any(db_map_cascading_data.values()):
+        db_map_cascading_data = self.find_cascading_relationships(db_map_ids)
+        if not db_map_cascading_data:
             return
         db_map_cascading_data = {
             db_map: self.get_relationships(db_map, ids={x["id"] for x in data}, cache=False)
@@ -1237,190 +1774,149 @@ class SpineDBManager(QObject):
         }
         self.relationships_updated.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_parameter_definitions")
-    def cascade_refresh_parameter_definitions(self, db_map_data):
+    def cascade_refresh_parameter_definitions(self, db_map_ids):
         """Refreshes cached parameter definitions in cascade when updating entity classes.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_data(self._to_ids(db_map_data), "parameter definition")
-        if not any(db_map_cascading_data.values()):
-            return
-        db_map_cascading_data = {
-            db_map: self.get_parameter_definitions(db_map, ids={x["id"] for x in data}, cache=False)
-            for db_map, data in db_map_cascading_data.items()
-        }
-        self._parameter_definitions_updated.emit(db_map_cascading_data)
+        db_map_cascading_data = self.find_cascading_parameter_data(db_map_ids, "parameter definition")
+        if db_map_cascading_data:
+            # do_update_parameter_definitions fetches the fresh items, the cached ones are enough to find them
+            self._parameter_definitions_updated.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_parameter_definitions_by_value_list")
-    def cascade_refresh_parameter_definitions_by_value_list(self, db_map_data):
+    def cascade_refresh_parameter_definitions_by_value_list(self, db_map_ids):
         """Refreshes cached parameter definitions when updating parameter value lists.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_definitions_by_value_list(self._to_ids(db_map_data))
-        if not any(db_map_cascading_data.values()):
-            return
-        db_map_cascading_data = {
-            db_map: self.get_parameter_definitions(db_map, ids={x["id"] for x in data}, cache=False)
-            for db_map, data in db_map_cascading_data.items()
-        }
-        self._parameter_definitions_updated.emit(db_map_cascading_data)
+        db_map_cascading_data = self.find_cascading_parameter_definitions_by_value_list(db_map_ids)
+        if db_map_cascading_data:
+            self._parameter_definitions_updated.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_parameter_definitions_by_tag")
-    def cascade_refresh_parameter_definitions_by_tag(self, db_map_data):
+    def cascade_refresh_parameter_definitions_by_tag(self, db_map_ids):
         """Refreshes cached parameter definitions when updating parameter tags.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_definitions_by_tag(self._to_ids(db_map_data))
-        if not any(db_map_cascading_data.values()):
-            return
-        db_map_cascading_data = {
-            db_map: self.get_parameter_definitions(db_map, ids={x["id"] for x in data}, cache=False)
-            for db_map, data in db_map_cascading_data.items()
-        }
-        self._parameter_definitions_updated.emit(db_map_cascading_data)
+        db_map_cascading_data = self.find_cascading_parameter_definitions_by_tag(db_map_ids)
+        if db_map_cascading_data:
+            self._parameter_definitions_updated.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_parameter_values_by_entity_class")
-    def cascade_refresh_parameter_values_by_entity_class(self, db_map_data):
-        """Refreshes cached parameter values in cascade when updating entity classes.
+    def cascade_refresh_parameter_values_by_entity(self, db_map_ids):
+        """Refreshes cached parameter values in cascade when updating entities.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_data(self._to_ids(db_map_data), "parameter value")
-        if not any(db_map_cascading_data.values()):
-            return
-        db_map_cascading_data = {
-            db_map: self.get_parameter_values(db_map, ids={x["id"] for x in data}, cache=False)
-            for db_map, data in db_map_cascading_data.items()
-        }
-        self._parameter_values_updated.emit(db_map_cascading_data)
+        db_map_cascading_data = self.find_cascading_parameter_values_by_entity(db_map_ids)
+        if db_map_cascading_data:
+            self._parameter_values_updated.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_parameter_values_by_entity")
-    def cascade_refresh_parameter_values_by_entity(self, db_map_data):
-        """Refreshes cached parameter values in cascade when updating entities.
+    def cascade_refresh_parameter_values_by_entity_class(self, db_map_ids):
+        """Refreshes cached parameter values in cascade when updating entity classes.
+
+        The parameter definitions cascade only reaches values through definitions that are in the cache,
+        so cached values are looked up directly as well.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_values_by_entity(self._to_ids(db_map_data))
-        if not any(db_map_cascading_data.values()):
-            return
-        db_map_cascading_data = {
-            db_map: self.get_parameter_values(db_map, ids={x["id"] for x in data}, cache=False)
-            for db_map, data in db_map_cascading_data.items()
-        }
-        self._parameter_values_updated.emit(db_map_cascading_data)
+        db_map_cascading_data = self.find_cascading_parameter_data(db_map_ids, "parameter value")
+        if db_map_cascading_data:
+            self._parameter_values_updated.emit(db_map_cascading_data)
 
-    @Slot("QVariant", name="cascade_refresh_parameter_values_by_definition")
-    def cascade_refresh_parameter_values_by_definition(self, db_map_data):
+    def cascade_refresh_parameter_values_by_definition(self, db_map_ids):
         """Refreshes cached parameter values in cascade when updating parameter definitions.
 
         Args:
-            db_map_data (dict): lists of updated items keyed by DiffDatabaseMapping
+            db_map_ids (dict): sets of updated ids keyed by DiffDatabaseMapping
         """
-        db_map_cascading_data = self.find_cascading_parameter_values_by_definition(self._to_ids(db_map_data))
-        if not any(db_map_cascading_data.values()):
-            return
-        db_map_cascading_data = {
-            db_map: self.get_parameter_values(db_map, ids={x["id"] for x in data}, cache=False)
-            for db_map, data in db_map_cascading_data.items()
-        }
-        self._parameter_values_updated.emit(db_map_cascading_data)
+        db_map_cascading_data = self.find_cascading_parameter_values_by_definition(db_map_ids)
+        if db_map_cascading_data:
+            self._parameter_values_updated.emit(db_map_cascading_data)
 
     def find_cascading_relationship_classes(self, db_map_ids):
         """Finds and returns cascading relationship classes for the given object class ids."""
         db_map_cascading_data = dict()
         for db_map, object_class_ids in db_map_ids.items():
-            object_class_ids = {str(id_) for id_ in object_class_ids}
-            db_map_cascading_data[db_map] = [
-                item
-                for item in self.get_items(db_map, "relationship class")
-                if object_class_ids.intersection(item["object_class_id_list"].split(","))
-            ]
+            items = self._find_items_by_id_list_field(
+                db_map, "relationship class", "object_class_id_list", object_class_ids
+            )
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
     def find_cascading_entities(self, db_map_ids, item_type):
         """Finds and returns cascading entities for the given entity class ids."""
         db_map_cascading_data = dict()
         for db_map, class_ids in db_map_ids.items():
-            db_map_cascading_data[db_map] = [
-                item for item in self.get_items(db_map, item_type) if item["class_id"] in class_ids
-            ]
+            items = self._find_items_by_field(db_map, item_type, "class_id", class_ids)
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
     def find_cascading_relationships(self, db_map_ids):
         """Finds and returns cascading relationships for the given object ids."""
         db_map_cascading_data = dict()
         for db_map, object_ids in db_map_ids.items():
-            object_ids = {str(id_) for id_ in object_ids}
-            db_map_cascading_data[db_map] = [
-                item
-                for item in self.get_items(db_map, "relationship")
-                if object_ids.intersection(item["object_id_list"].split(","))
-            ]
+            items = self._find_items_by_id_list_field(db_map, "relationship", "object_id_list", object_ids)
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
     def find_cascading_parameter_data(self, db_map_ids, item_type):
         """Finds and returns cascading parameter definitions or values for the given entity class ids."""
         db_map_cascading_data = dict()
         for db_map, entity_class_ids in db_map_ids.items():
-            db_map_cascading_data[db_map] = [
-                item
-                for item in self.get_items(db_map, item_type)
-                if entity_class_ids.intersection([item.get("object_class_id"), item.get("relationship_class_id")])
-            ]
+            items = self._find_items_by_field(
+                db_map, item_type, "object_class_id", entity_class_ids
+            ) + self._find_items_by_field(db_map, item_type, "relationship_class_id", entity_class_ids)
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
     def find_cascading_parameter_definitions_by_value_list(self, db_map_ids):
         """Finds and returns cascading parameter definitions for the given parameter value list ids."""
         db_map_cascading_data = dict()
         for db_map, value_list_ids in db_map_ids.items():
-            db_map_cascading_data[db_map] = [
-                item
-                for item in self.get_items(db_map, "parameter definition")
-                if item["value_list_id"] in value_list_ids
-            ]
+            items = self._find_items_by_field(db_map, "parameter definition", "value_list_id", value_list_ids)
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
     def find_cascading_parameter_definitions_by_tag(self, db_map_ids):
         """Finds and returns cascading parameter definitions for the given parameter tag ids."""
         db_map_cascading_data = dict()
         for db_map, tag_ids in db_map_ids.items():
-            tag_ids = {str(id_) for id_ in tag_ids}
-            db_map_cascading_data[db_map] = [
-                item
-                for item in self.get_items(db_map, "parameter definition")
-                if tag_ids.intersection((item["parameter_tag_id_list"] or "0").split(","))
-            ]  # NOTE: 0 is 'untagged'
+            # NOTE: 0 is 'untagged'
+            items = self._find_items_by_id_list_field(db_map, "parameter definition", "parameter_tag_id_list", tag_ids)
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
     def find_cascading_parameter_values_by_entity(self, db_map_ids):
         """Finds and returns cascading parameter values for the given entity ids."""
         db_map_cascading_data = dict()
         for db_map, entity_ids in db_map_ids.items():
-            db_map_cascading_data[db_map] = [
-                item
-                for item in self.get_items(db_map, "parameter value")
-                if entity_ids.intersection([item.get("object_id"), item.get("relationship_id")])
-            ]
+            items = self._find_items_by_field(
+                db_map, "parameter value", "object_id", entity_ids
+            ) + self._find_items_by_field(db_map, "parameter value", "relationship_id", entity_ids)
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
     def find_cascading_parameter_values_by_definition(self, db_map_ids):
         """Finds and returns cascading parameter values for the given parameter definition ids."""
         db_map_cascading_data = dict()
         for db_map, definition_ids in db_map_ids.items():
-            db_map_cascading_data[db_map] = [
-                item for item in self.get_items(db_map, "parameter value") if item["parameter_id"] in definition_ids
-            ]
+            items = self._find_items_by_field(db_map, "parameter value", "parameter_id", definition_ids)
+            if items:
+                db_map_cascading_data[db_map] = items
         return db_map_cascading_data
 
-    @Slot("QVariant")
     def do_add_parameter_definitions(self, db_map_data):
         """Adds parameter definitions in extended format given data in compact format.
 
@@ -1428,12 +1924,16 @@ class SpineDBManager(QObject):
             db_map_data (dict): lists of parameter definition items keyed by DiffDatabaseMapping
         """
         d = {
-            db_map: self.get_parameter_definitions(db_map, ids={x["id"] for x in items})
+            db_map: self.get_parameter_definitions(
+                db_map,
+                ids={x["id"] for x in items},
+                entity_type=self._parameter_definition_entity_type(items),
+            )
             for db_map, items in db_map_data.items()
+            if items
         }
         self.parameter_definitions_added.emit(d)
 
-    @Slot("QVariant")
     def do_add_parameter_values(self, db_map_data):
         """Adds parameter values in extended format given data in compact format.
 
@@ -1441,12 +1941,16 @@ class SpineDBManager(QObject):
             db_map_data (dict): lists of parameter value items keyed by DiffDatabaseMapping
         """
         d = {
-            db_map: self.get_parameter_values(db_map, ids={x["id"] for x in items})
+            db_map: self.get_parameter_values(
+                db_map,
+                ids={x["id"] for x in items},
+                entity_type=self._parameter_value_entity_type(items),
+            )
             for db_map, items in db_map_data.items()
+            if items
         }
         self.parameter_values_added.emit(d)
 
-    @Slot("QVariant")
     def do_update_parameter_definitions(self, db_map_data):
         """Updates parameter definitions in extended format given data in compact format.
 
@@ -1454,12 +1958,16 @@ class SpineDBManager(QObject):
             db_map_data (dict): lists of parameter definition items keyed by DiffDatabaseMapping
         """
         d = {
-            db_map: self.get_parameter_definitions(db_map, ids={x["id"] for x in items})
+            db_map: self.get_parameter_definitions(
+                db_map,
+                ids={x["id"] for x in items},
+                entity_type=self._parameter_definition_entity_type(items),
+            )
             for db_map, items in db_map_data.items()
+            if items
         }
         self.parameter_definitions_updated.emit(d)
 
-    @Slot("QVariant")
     def do_update_parameter_values(self, db_map_data):
         """Updates parameter values in extended format given data in compact format.
 
@@ -1467,12 +1975,16 @@ class SpineDBManager(QObject):
             db_map_data (dict): lists of parameter value items keyed by DiffDatabaseMapping
         """
         d = {
-            db_map: self.get_parameter_values(db_map, ids={x["id"] for x in items})
+            db_map: self.get_parameter_values(
+                db_map,
+                ids={x["id"] for x in items},
+                entity_type=self._parameter_value_entity_type(items),
+            )
             for db_map, items in db_map_data.items()
+            if items
         }
         self.parameter_values_updated.emit(d)
 
-    @Slot("QVariant")
     def cache_parameter_definition_tags(self, db_map_data):
         """Caches parameter definition tags in the parameter definition dictionary.
 
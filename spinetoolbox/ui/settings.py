@@ -424,7 +424,7 @@ class Ui_SettingsForm(object):
         self.retranslateUi(SettingsForm)
         self.listWidget.setCurrentRow(-1)
         self.stackedWidget.setCurrentIndex(3)
-        QtCore.QObject.connect(self.listWidget, QtCore.SIGNAL("currentRowChanged(int)"), self.stackedWidget.setCurrentIndex)
+        self.listWidget.currentRowChanged.connect(self.stackedWidget.setCurrentIndex)
         QtCore.QMetaObject.connectSlotsByName(SettingsForm)
         SettingsForm.setTabOrder(self.listWidget, self.checkBox_open_previous_project)
         SettingsForm.setTabOrder(self.checkBox_open_previous_project, self.checkBox_exit_prompt)
@@ -54,11 +54,15 @@ class CustomLineEditor(QLineEdit):
     """A custom QLineEdit to handle data from models.
     """
 
+    _int_validator = None
+
     def set_data(self, data):
         if data is not None:
             self.setText(str(data))
         if isinstance(data, int):
-            self.setValidator(QIntValidator(self))
+            if CustomLineEditor._int_validator is None:
+                CustomLineEditor._int_validator = QIntValidator()
+            self.setValidator(CustomLineEditor._int_validator)
 
     def data(self):
         return self.text()
@@ -81,7 +85,7 @@ class CustomComboEditor(QComboBox):
             self.setCurrentText(current_text)
         else:
             self.setCurrentIndex(-1)
-        self.activated.connect(lambda: self.data_committed.emit())  # pylint: disable=unnecessary-lambda
+        self.activated.connect(self.data_committed)
         self.showPopup()
 
     def data(self):
@@ -102,7 +106,7 @@ class CustomLineEditDelegate(QItemDelegate):
         """
         editor = CustomLineEditor(parent)
         editor.set_data(index.data())
-        editor.textEdited.connect(lambda s: self.text_edited.emit(s))  # pylint: disable=unnecessary-lambda
+        editor.textEdited.connect(self.text_edited)
         return editor
 
     def eventFilter(self, editor, event):
@@ -139,6 +143,7 @@ class SearchBarEditor(QTableView):
         self._tutor = tutor
         self._base_size = None
         self._original_text = None
+        self._filter_prefix = ""
         self._orig_pos = None
         self.first_index = QModelIndex()
         self.model = QStandardItemModel(self)
@@ -163,10 +168,11 @@ class SearchBarEditor(QTableView):
             items (Sequence(str))
         """
         item_list = [QStandardItem(current)]
+        flags = ~Qt.ItemIsEditable
         for item in items:
             qitem = QStandardItem(item)
             item_list.append(qitem)
-            qitem.setFlags(~Qt.ItemIsEditable)
+            qitem.setFlags(flags)
         self.model.invisibleRootItem().appendRows(item_list)
         self.first_index = self.proxy_model.mapFromSource(self.model.index(0, 0))
 
@@ -203,16 +209,17 @@ class SearchBarEditor(QTableView):
     def _handle_delegate_text_edited(self, text):
         """Filters model as the first row is being edited."""
         self._original_text = text
-        self.proxy_model.setFilterRegExp("^" + text)
+        self._filter_prefix = text
+        self.proxy_model.invalidateFilter()
         self.proxy_model.setData(self.first_index, text)
         self.refit()
 
     def _proxy_model_filter_accepts_row(self, source_row, source_parent):
-        """Always accept first row.
+        """Always accept first row, accept the others if they start with the text being edited.
         """
         if source_row == 0:
             return True
-        return QSortFilterProxyModel.filterAcceptsRow(self.proxy_model, source_row, source_parent)
+        return self.model.index(source_row, 0, source_parent).data().startswith(self._filter_prefix)
 
     def keyPressEvent(self, event):
         """Sets data from current index into first index as the user navigates
@@ -250,7 +257,7 @@ class SearchBarEditor(QTableView):
         if not self.currentIndex().isValid():
             return
         index = self.indexAt(event.pos())
-        if index.row() == 0:
+        if index.row() == 0 or index == self.currentIndex():
             return
         self.setCurrentIndex(index)
 
@@ -300,6 +307,8 @@ class CheckListEditor(QTableView):
     def mouseMoveEvent(self, event):
         """Sets the current index to the one under mouse."""
         index = self.indexAt(event.pos())
+        if index == self.currentIndex():
+            return
         self.setCurrentIndex(index)
 
     def mousePressEvent(self, event):
@@ -314,15 +323,20 @@ class CheckListEditor(QTableView):
             items (Sequence(str)): All items.
             checked_items (Sequence(str)): Initially checked items.
         """
+        checked_items = set(checked_items)
+        flags = ~Qt.ItemIsEditable & ~Qt.ItemIsUserCheckable
+        background = qApp.palette().window()  # pylint: disable=undefined-variable
+        item_list = []
         for item in items:
             qitem = QStandardItem(item)
             if item in checked_items:
                 qitem.setCheckState(Qt.Checked)
             else:
                 qitem.setCheckState(Qt.Unchecked)
-            qitem.setFlags(~Qt.ItemIsEditable & ~Qt.ItemIsUserCheckable)
-            qitem.setData(qApp.palette().window(), Qt.BackgroundRole)  # pylint: disable=undefined-variable
-            self.model.appendRow(qitem)
+            qitem.setFlags(flags)
+            qitem.setData(background, Qt.BackgroundRole)
+            item_list.append(qitem)
+        self.model.invisibleRootItem().appendRows(item_list)
         self.selectionModel().select(self.model.index(0, 0), QItemSelectionModel.Select)
 
     def data(self):
@@ -332,7 +346,8 @@ class CheckListEditor(QTableView):
             str
         """
         data = []
-        for q in self.model.findItems('*', Qt.MatchWildcard):
+        for row in range(self.model.rowCount()):
+            q = self.model.item(row)
             if q.checkState() == Qt.Checked:
                 data.append(q.text())
         return ",".join(data)
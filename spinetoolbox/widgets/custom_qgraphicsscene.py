@@ -33,6 +33,9 @@ class CustomQGraphicsScene(ShrinkingScene):
             toolbox (ToolboxUI): reference to the main window
         """
         super().__init__(400.0, 300.0, parent)
+        # The Design view holds only a handful of items that move and get linked all the time,
+        # so a linear search beats keeping a BSP index up to date
+        self.setItemIndexMethod(ShrinkingScene.NoIndex)
         self._toolbox = toolbox
         self.item_shadow = None
         self.sync_selection = True
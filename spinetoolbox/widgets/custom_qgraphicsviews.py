@@ -39,8 +39,14 @@ class CustomQGraphicsView(QGraphicsView):
         super().__init__(parent=parent)
         self._zoom_factor_base = 1.0015
         self._angle = 120
+        self._zoom_in_factor = self._zoom_factor_base ** self._angle
+        self._zoom_out_factor = 1.0 / self._zoom_in_factor
         self._num_scheduled_scalings = 0
-        self.anim = None
+        self._zoom_focus = None
+        self.anim = QTimeLine(200, self)
+        self.anim.setUpdateInterval(20)
+        self.anim.valueChanged.connect(self.scaling_time)
+        self.anim.finished.connect(self.anim_finished)
         self._scene_fitting_zoom = 1.0
         self._max_zoom = 10.0
         self._min_zoom = 0.1
@@ -110,12 +116,8 @@ class CustomQGraphicsView(QGraphicsView):
             self._num_scheduled_scalings += num_steps
             if self._num_scheduled_scalings * num_steps < 0:
                 self._num_scheduled_scalings = num_steps
-            if self.anim:
-                self.anim.deleteLater()
-            self.anim = QTimeLine(200, self)
-            self.anim.setUpdateInterval(20)
-            self.anim.valueChanged.connect(lambda x, pos=event.pos(): self.scaling_time(pos))
-            self.anim.finished.connect(self.anim_finished)
+            self._zoom_focus = event.pos()
+            self.anim.stop()
             self.anim.start()
         else:
             angle = event.angleDelta().y()
@@ -170,10 +172,11 @@ class CustomQGraphicsView(QGraphicsView):
         self._scene_fitting_zoom = extent / scene_extent
         self._min_zoom = min(self._scene_fitting_zoom, 0.1)
 
-    def scaling_time(self, pos):
+    @Slot(float)
+    def scaling_time(self, _):
         """Called when animation value for smooth zoom changes. Perform zoom."""
         factor = 1.0 + self._num_scheduled_scalings / 100.0
-        self.gentle_zoom(factor, pos)
+        self.gentle_zoom(factor, self._zoom_focus)
 
     def anim_finished(self):
         """Called when animation for smooth zoom finishes. Clean up."""
@@ -181,16 +184,14 @@ class CustomQGraphicsView(QGraphicsView):
             self._num_scheduled_scalings -= 1
         else:
             self._num_scheduled_scalings += 1
-        self.sender().deleteLater()
-        self.anim = None
 
     def zoom_in(self):
         """Perform a zoom in with a fixed scaling."""
-        self.gentle_zoom(self._zoom_factor_base ** self._angle, self.viewport().rect().center())
+        self.gentle_zoom(self._zoom_in_factor, self.viewport().rect().center())
 
     def zoom_out(self):
         """Perform a zoom out with a fixed scaling."""
-        self.gentle_zoom(self._zoom_factor_base ** -self._angle, self.viewport().rect().center())
+        self.gentle_zoom(self._zoom_out_factor, self.viewport().rect().center())
 
     def reset_zoom(self):
         """Reset zoom to the default factor."""
@@ -388,20 +389,19 @@ class DesignQGraphicsView(CustomQGraphicsView):
         """
         if not connections:
             return
+        project_items = {item.name: item.project_item for item in self._project_item_model.items()}
         for conn in connections:
             src_name, src_anchor = conn["from"]
             dst_name, dst_anchor = conn["to"]
             # Do not restore feedback links
             if src_name == dst_name:
                 continue
-            src_ind = self._project_item_model.find_item(src_name)
-            dst_ind = self._project_item_model.find_item(dst_name)
-            if not src_ind or not dst_ind:
+            src_item = project_items.get(src_name)
+            dst_item = project_items.get(dst_name)
+            if src_item is None or dst_item is None:
                 self._toolbox.msg_warning.emit("Restoring a connection failed")
                 continue
-            src_item = self._project_item_model.item(src_ind).project_item
             src_connector = src_item.get_icon().conn_button(src_anchor)
-            dst_item = self._project_item_model.item(dst_ind).project_item
             dst_connector = dst_item.get_icon().conn_button(dst_anchor)
             self.add_link(src_connector, dst_connector)
 
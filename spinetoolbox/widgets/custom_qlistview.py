@@ -18,7 +18,7 @@ Classes for custom QListView.
 
 from PySide2.QtWidgets import QListView, QApplication
 from PySide2.QtGui import QDrag
-from PySide2.QtCore import Qt, QMimeData, Slot, QItemSelectionModel
+from PySide2.QtCore import Qt, QMimeData, Slot, QItemSelectionModel, QPersistentModelIndex
 
 
 class AutoFilterMenuView(QListView):
@@ -64,8 +64,7 @@ class DragListView(QListView):
         """Initialize the view."""
         super().__init__(parent=parent)
         self.drag_start_pos = None
-        self.pixmap = None
-        self.mime_data = None
+        self.drag_index = None
 
     def mousePressEvent(self, event):
         """Register drag start position"""
@@ -74,14 +73,10 @@ class DragListView(QListView):
             index = self.indexAt(event.pos())
             if not index.isValid() or index == index.model().new_index:
                 self.drag_start_pos = None
-                self.pixmap = None
-                self.mime_data = None
+                self.drag_index = None
                 return
             self.drag_start_pos = event.pos()
-            self.pixmap = index.data(Qt.DecorationRole).pixmap(self.iconSize())
-            entity_class_id = index.data(Qt.UserRole + 1)
-            self.mime_data = QMimeData()
-            self.mime_data.setText(str(entity_class_id))
+            self.drag_index = QPersistentModelIndex(index)
 
     def mouseMoveEvent(self, event):
         """Start dragging action if needed"""
@@ -91,18 +86,21 @@ class DragListView(QListView):
             return
         if (event.pos() - self.drag_start_pos).manhattanLength() < QApplication.startDragDistance():
             return
-        drag = QDrag(self)
-        drag.setPixmap(self.pixmap)
-        drag.setMimeData(self.mime_data)
-        drag.setHotSpot(self.pixmap.rect().center())
-        drag.exec_()
+        if self.drag_index.isValid():
+            pixmap = self.drag_index.data(Qt.DecorationRole).pixmap(self.iconSize())
+            entity_class_id = self.drag_index.data(Qt.UserRole + 1)
+            mime_data = QMimeData()
+            mime_data.setText(str(entity_class_id))
+            drag = QDrag(self)
+            drag.setPixmap(pixmap)
+            drag.setMimeData(mime_data)
+            drag.setHotSpot(pixmap.rect().center())
+            drag.exec_()
         self.drag_start_pos = None
-        self.pixmap = None
-        self.mime_data = None
+        self.drag_index = None
 
     def mouseReleaseEvent(self, event):
         """Forget drag start position"""
         super().mouseReleaseEvent(event)
         self.drag_start_pos = None
-        self.pixmap = None
-        self.mime_data = None
+        self.drag_index = None
@@ -309,6 +309,8 @@ class DataStoreFormBase(QMainWindow):
         if dialog.exec() == QDialog.Accepted:
             if db_map.has_pending_changes():
                 self.msg.emit("Import successful")
+                # The data was imported straight into the db, so the cache doesn't know about it
+                self.db_mngr.refresh_session(db_map)
                 self.init_models()
         dialog.close()
         dialog.deleteLater()
@@ -400,6 +402,7 @@ class DataStoreFormBase(QMainWindow):
 
     @Slot(bool)
     def refresh_session(self, checked=False):
+        self.db_mngr.refresh_session(*self.db_maps)
         self.init_models()
         msg = "Session refreshed."
         self.msg.emit(msg)
@@ -17,6 +17,7 @@ Unit tests for the TimePatternModel class.
 """
 
 import unittest
+from unittest import mock
 import numpy as np
 import numpy.testing
 from PySide2.QtCore import Qt
@@ -80,6 +81,13 @@ class TestTimePatternModel(unittest.TestCase):
         self.assertEqual(model.value.indexes, ['a', 'c'])
         numpy.testing.assert_equal(model.value.values, np.array([-5.0, 7.0]))
 
+    def test_remove_multiple_rows_from_the_middle(self):
+        model = TimePatternModel(TimePattern(['a', 'b', 'c', 'd'], [-5.0, 3.0, 4.0, 7.0]))
+        self.assertTrue(model.removeRows(1, 2))
+        self.assertEqual(len(model.value), 2)
+        self.assertEqual(model.value.indexes, ['a', 'd'])
+        numpy.testing.assert_equal(model.value.values, np.array([-5.0, 7.0]))
+
     def test_remove_rows_from_the_end(self):
         model = TimePatternModel(TimePattern(['a', 'b'], [-5.0, 7.0]))
         self.assertTrue(model.removeRows(1, 1))
@@ -105,6 +113,15 @@ class TestTimePatternModel(unittest.TestCase):
         self.assertEqual(model.value.indexes, ['a', 'b'])
         numpy.testing.assert_equal(model.value.values, [-5.0, 2.3])
 
+    def test_setData_does_not_emit_dataChanged_when_value_is_unchanged(self):
+        model = TimePatternModel(TimePattern(['a', 'b'], [-5.0, 7.0]))
+        model_index = model.index(1, 1)
+        data_changed_slot = mock.MagicMock()
+        model.dataChanged.connect(data_changed_slot)
+        self.assertFalse(model.setData(model_index, 7.0))
+        data_changed_slot.assert_not_called()
+        numpy.testing.assert_equal(model.value.values, [-5.0, 7.0])
+
     def test_batch_set_data(self):
         model = TimePatternModel(TimePattern(['a', 'b', 'c'], [-5.0, 3.0, 7.0]))
         indexes = [model.index(0, 0), model.index(1, 1), model.index(2, 1)]
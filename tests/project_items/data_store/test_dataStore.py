@@ -35,10 +35,8 @@ class TestDataStore(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Overridden method. Runs once before all tests in this class."""
-        try:
-            cls.app = QApplication().processEvents()
-        except RuntimeError:
-            pass
+        if not QApplication.instance():
+            QApplication()
         logging.basicConfig(
             stream=sys.stderr,
             level=logging.DEBUG,
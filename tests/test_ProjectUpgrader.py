@@ -33,10 +33,8 @@ class TestProjectUpgrader(unittest.TestCase):
     def setUpClass(cls):
         """Overridden method. Runs once before all tests in this class."""
         qInitResources()
-        try:
-            cls.app = QApplication().processEvents()
-        except RuntimeError:
-            pass
+        if not QApplication.instance():
+            QApplication()
         logging.basicConfig(
             stream=sys.stderr,
             level=logging.DEBUG,
@@ -16,11 +16,16 @@ Unit tests for the spine_db_manager module.
 :date:   12.7.2019
 """
 
+import os.path
+from tempfile import TemporaryDirectory
 import unittest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QApplication
 from spinedb_api import (
+    create_new_spine_database,
+    import_object_classes,
+    import_objects,
     to_database,
     DateTime,
     Duration,
@@ -28,7 +33,7 @@ from spinedb_api import (
     TimeSeriesFixedResolution,
     TimeSeriesVariableResolution,
 )
-from spinetoolbox.spine_db_manager import SpineDBManager
+from spinetoolbox.spine_db_manager import SpineDBManager, _HandlerChain
 
 
 class TestParameterValueFormatting(unittest.TestCase):
@@ -171,5 +176,258 @@ class TestParameterValueFormatting(unittest.TestCase):
         self.assertEqual(formatted, 'Could not decode the value')
 
 
+class TestCache(unittest.TestCase):
+    """Tests for the item cache in SpineDBManager."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self.db_mngr = SpineDBManager(None, None)
+        self.db_map = MagicMock()
+
+    def tearDown(self):
+        self.db_mngr.deleteLater()
+
+    def _replace_getter(self, getter_name, item_type, items):
+        """Replaces a getter of the manager with a mock that caches and returns the given items."""
+
+        def get_items(db_map, *args, **kwargs):
+            self.db_mngr.cache_items(item_type, {db_map: items})
+            return items
+
+        getter = Mock(side_effect=get_items)
+        setattr(self.db_mngr, getter_name, getter)
+        return getter
+
+    def test_miss_after_full_fetch_does_not_query_again(self):
+        object_ = {"id": 1, "class_id": 1, "name": "node"}
+        getter = self._replace_getter("get_objects", "object", [object_])
+        self.assertEqual(self.db_mngr.get_item(self.db_map, "object", 1), object_)
+        self.assertEqual(getter.call_count, 1)
+        self.assertEqual(self.db_mngr.get_item(self.db_map, "object", 2), {})
+        self.assertEqual(self.db_mngr.get_items_by_id(self.db_map, "object", {1, 2}), {1: object_, 2: {}})
+        self.assertEqual(self.db_mngr.get_items_by_field(self.db_map, "object", "class_id", 2), [])
+        self.assertEqual(getter.call_count, 1)
+
+    def test_miss_before_full_fetch_queries_the_db(self):
+        object_ = {"id": 1, "class_id": 1, "name": "node"}
+        self.db_mngr.cache_items("object", {self.db_map: [object_]})
+        getter = self._replace_getter("get_objects", "object", [object_])
+        self.assertEqual(self.db_mngr.get_item(self.db_map, "object", 1), object_)
+        getter.assert_not_called()
+        self.assertEqual(self.db_mngr.get_item(self.db_map, "object", 2), {})
+        getter.assert_called_once()
+
+    def test_field_index_is_rebuilt_after_caching_and_uncaching(self):
+        node = {"id": 1, "class_id": 1, "name": "node"}
+        unit = {"id": 2, "class_id": 2, "name": "unit"}
+        self._replace_getter("get_objects", "object", [node, unit])
+        self.assertEqual(self.db_mngr.get_items_by_field(self.db_map, "object", "class_id", 1), [node])
+        other_node = {"id": 3, "class_id": 1, "name": "other node"}
+        self.db_mngr.cache_items("object", {self.db_map: [other_node]})
+        self.assertEqual(self.db_mngr.get_items_by_field(self.db_map, "object", "class_id", 1), [node, other_node])
+        self.db_mngr.uncache_items("object", {self.db_map: [node]})
+        self.assertEqual(self.db_mngr.get_items_by_field(self.db_map, "object", "class_id", 1), [other_node])
+        self.assertEqual(self.db_mngr.get_items_by_field(self.db_map, "object", "class_id", 2), [unit])
+
+    def test_id_list_lookup(self):
+        tagged = {"id": 1, "object_class_id": 1, "parameter_tag_id_list": "1,2"}
+        untagged = {"id": 2, "object_class_id": 1, "parameter_tag_id_list": None}
+        also_tagged = {"id": 3, "object_class_id": 1, "parameter_tag_id_list": "2"}
+        self._replace_getter("get_parameter_definitions", "parameter definition", [tagged, untagged, also_tagged])
+        find = self.db_mngr.find_cascading_parameter_definitions_by_tag
+        self.assertEqual(find({self.db_map: {2}}), {self.db_map: [tagged, also_tagged]})
+        self.assertEqual(find({self.db_map: {1, 2}}), {self.db_map: [tagged, also_tagged]})
+        # 0 is 'untagged'
+        self.assertEqual(find({self.db_map: {0}}), {self.db_map: [untagged]})
+        self.assertEqual(find({self.db_map: {3}}), {})
+
+    def test_id_list_index_is_rebuilt_after_caching_and_uncaching(self):
+        tagged = {"id": 1, "object_class_id": 1, "parameter_tag_id_list": "1"}
+        self._replace_getter("get_parameter_definitions", "parameter definition", [tagged])
+        find = self.db_mngr.find_cascading_parameter_definitions_by_tag
+        self.assertEqual(find({self.db_map: {1}}), {self.db_map: [tagged]})
+        new_tagged = {"id": 2, "object_class_id": 1, "parameter_tag_id_list": "1,3"}
+        self.db_mngr.cache_items("parameter definition", {self.db_map: [new_tagged]})
+        self.assertEqual(find({self.db_map: {1}}), {self.db_map: [tagged, new_tagged]})
+        self.db_mngr.uncache_items("parameter definition", {self.db_map: [tagged]})
+        self.assertEqual(find({self.db_map: {1}}), {self.db_map: [new_tagged]})
+
+    def test_cascade_removal_emits_items_removed_from_cache_once(self):
+        object_class = {"id": 1, "name": "node"}
+        object_ = {"id": 2, "class_id": 1, "name": "nemo"}
+        definition = {"id": 3, "object_class_id": 1, "parameter_tag_id_list": None, "value_list_id": None}
+        value = {"id": 4, "object_class_id": 1, "object_id": 2, "parameter_id": 3, "value": "1.0"}
+        self.db_mngr.cache_items("object class", {self.db_map: [object_class]})
+        self.db_mngr.cache_items("object", {self.db_map: [object_]})
+        self.db_mngr.cache_items("parameter definition", {self.db_map: [definition]})
+        self.db_mngr.cache_items("parameter value", {self.db_map: [value]})
+        uncached = []
+        self.db_mngr.items_removed_from_cache.connect(lambda db_map_typed_data: uncached.append(db_map_typed_data))
+        self.db_mngr.do_remove_items({self.db_map: {"object class": [object_class]}})
+        self.assertEqual(len(uncached), 1)
+        typed_data = uncached[0][self.db_map]
+        # Children come before their parents, so undoing can re-add them in reverse order
+        self.assertEqual(list(typed_data), ["parameter value", "object", "parameter definition", "object class"])
+        self.assertEqual(typed_data["parameter value"], [value])
+        self.assertEqual(typed_data["object"], [object_])
+        self.assertEqual(typed_data["parameter definition"], [definition])
+        self.assertEqual(typed_data["object class"], [object_class])
+
+    def test_uncaching_outside_removal_emits_immediately(self):
+        object_ = {"id": 1, "class_id": 1, "name": "node"}
+        self.db_mngr.cache_items("object", {self.db_map: [object_]})
+        uncached = []
+        self.db_mngr.items_removed_from_cache.connect(lambda db_map_typed_data: uncached.append(db_map_typed_data))
+        self.db_mngr.uncache_items("object", {self.db_map: [object_]})
+        self.assertEqual(uncached, [{self.db_map: {"object": [object_]}}])
+
+
+class TestCacheWithDatabase(unittest.TestCase):
+    """Tests for keeping the item cache in SpineDBManager in sync with a real database."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._url = "sqlite:///" + os.path.join(self._temp_dir.name, "db.sqlite")
+        create_new_spine_database(self._url)
+        self.db_mngr = SpineDBManager(None, None)
+        self.db_map = self.db_mngr.get_db_map(self._url)
+
+    def tearDown(self):
+        self.db_mngr.close_session(self._url)
+        self.db_mngr.deleteLater()
+        self._temp_dir.cleanup()
+
+    def test_items_imported_directly_into_db_are_found_after_refresh(self):
+        import_object_classes(self.db_map, ("unit",))
+        self.db_mngr.get_object_classes(self.db_map)
+        self.db_mngr.get_objects(self.db_map)
+        import_objects(self.db_map, (("unit", "node"),))
+        object_id = self.db_map.query(self.db_map.object_sq).filter_by(name="node").one().id
+        self.assertEqual(self.db_mngr.get_item(self.db_map, "object", object_id), {})
+        self.db_mngr.refresh_session(self.db_map)
+        self.assertEqual(self.db_mngr.get_item(self.db_map, "object", object_id)["name"], "node")
+        self.assertEqual(self.db_mngr.get_item_by_field(self.db_map, "object", "name", "node")["id"], object_id)
+
+    def test_close_session_drops_everything_cached_for_the_db_map(self):
+        import_object_classes(self.db_map, ("unit",))
+        self.db_mngr.get_object_classes(self.db_map)
+        self.db_mngr.get_item_by_field(self.db_map, "object class", "name", "unit")
+        self.db_mngr.close_session(self._url)
+        self.assertFalse([key for key in self.db_mngr._cache if key[0] is self.db_map])
+        self.assertFalse([key for key in self.db_mngr._field_indexes if key[0] is self.db_map])
+        self.assertFalse([key for key in self.db_mngr._fully_fetched if key[0] is self.db_map])
+        self.assertFalse([key for key in self.db_mngr._entity_class_icons if key[0] is self.db_map])
+
+
+class TestCascadeRemoval(unittest.TestCase):
+    """Tests for removing items in cascade in SpineDBManager."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self.db_mngr = SpineDBManager(None, None)
+        # A MagicMock db map answers every query with no rows, as if the removed items were already gone
+        self.db_map = MagicMock()
+
+    def tearDown(self):
+        self.db_mngr.deleteLater()
+
+    def test_removing_object_class_removes_cached_values_when_definitions_are_not_cached(self):
+        object_class = {"id": 1, "name": "unit"}
+        value = {"id": 5, "object_class_id": 1, "object_id": 2, "parameter_id": 3, "value": "1.0"}
+        self.db_mngr.cache_items("object class", {self.db_map: [object_class]})
+        self.db_mngr.cache_items("parameter value", {self.db_map: [value]})
+        removed_values = []
+        self.db_mngr.parameter_values_removed.connect(lambda db_map_data: removed_values.append(db_map_data))
+        uncached = []
+        self.db_mngr.items_removed_from_cache.connect(lambda db_map_typed_data: uncached.append(db_map_typed_data))
+        self.db_mngr.do_remove_items({self.db_map: {"object class": [object_class]}})
+        self.assertEqual(removed_values, [{self.db_map: [value]}])
+        self.assertEqual(uncached, [{self.db_map: {"object class": [object_class], "parameter value": [value]}}])
+        self.assertNotIn(5, self.db_mngr._cache[self.db_map, "parameter value"])
+
+    def test_removing_relationship_class_removes_cached_values_when_definitions_are_not_cached(self):
+        relationship_class = {"id": 1, "name": "unit__node", "object_class_id_list": "2,3"}
+        value = {"id": 5, "relationship_class_id": 1, "relationship_id": 4, "parameter_id": 3, "value": "1.0"}
+        self.db_mngr.cache_items("relationship class", {self.db_map: [relationship_class]})
+        self.db_mngr.cache_items("parameter value", {self.db_map: [value]})
+        removed_values = []
+        self.db_mngr.parameter_values_removed.connect(lambda db_map_data: removed_values.append(db_map_data))
+        self.db_mngr.do_remove_items({self.db_map: {"relationship class": [relationship_class]}})
+        self.assertEqual(removed_values, [{self.db_map: [value]}])
+        self.assertNotIn(5, self.db_mngr._cache[self.db_map, "parameter value"])
+
+
+class TestCascadeRefresh(unittest.TestCase):
+    """Tests for refreshing cached items in cascade in SpineDBManager."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self.db_mngr = SpineDBManager(None, None)
+        # A MagicMock db map answers every query with no rows, so only cached items take part in the cascade
+        self.db_map = MagicMock()
+
+    def tearDown(self):
+        self.db_mngr.deleteLater()
+
+    def test_updating_object_class_refreshes_cached_values_when_definitions_are_not_cached(self):
+        object_class = {"id": 1, "name": "unit"}
+        value = {"id": 5, "object_class_id": 1, "object_id": 2, "parameter_id": 3, "value": "1.0"}
+        self.db_mngr.cache_items("object class", {self.db_map: [object_class]})
+        self.db_mngr.cache_items("parameter value", {self.db_map: [value]})
+        refreshed_values = []
+        self.db_mngr._parameter_values_updated.connect(lambda db_map_data: refreshed_values.append(db_map_data))
+        self.db_mngr.cascade_on_object_classes_updated({self.db_map: [object_class]})
+        self.assertEqual(refreshed_values, [{self.db_map: [value]}])
+
+    def test_updating_relationship_class_refreshes_cached_values_when_definitions_are_not_cached(self):
+        relationship_class = {"id": 1, "name": "unit__node", "object_class_id_list": "2,3"}
+        value = {"id": 5, "relationship_class_id": 1, "relationship_id": 4, "parameter_id": 3, "value": "1.0"}
+        self.db_mngr.cache_items("relationship class", {self.db_map: [relationship_class]})
+        self.db_mngr.cache_items("parameter value", {self.db_map: [value]})
+        refreshed_values = []
+        self.db_mngr._parameter_values_updated.connect(lambda db_map_data: refreshed_values.append(db_map_data))
+        self.db_mngr.cascade_on_relationship_classes_updated({self.db_map: [relationship_class]})
+        self.assertEqual(refreshed_values, [{self.db_map: [value]}])
+
+
+class TestHandlerChain(unittest.TestCase):
+    """Tests for the handler chain that SpineDBManager connects to its signals."""
+
+    def test_handlers_are_called_in_order(self):
+        calls = []
+        chain = _HandlerChain([lambda x: calls.append(("first", x)), lambda x: calls.append(("second", x))])
+        chain(23)
+        self.assertEqual(calls, [("first", 23), ("second", 23)])
+
+    def test_exception_in_handler_does_not_stop_the_rest(self):
+        def fail(_):
+            raise RuntimeError()
+
+        last_handler = Mock()
+        chain = _HandlerChain([fail, last_handler])
+        with patch("sys.excepthook") as excepthook:
+            chain(23)
+        excepthook.assert_called_once()
+        self.assertIs(excepthook.call_args[0][0], RuntimeError)
+        last_handler.assert_called_once_with(23)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -41,10 +41,8 @@ class TestSpineToolboxProject(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Runs once before any tests in this class."""
-        try:
-            cls.app = QApplication().processEvents()
-        except RuntimeError:
-            pass
+        if not QApplication.instance():
+            QApplication()
         logging.basicConfig(
             stream=sys.stderr,
             level=logging.DEBUG,
@@ -31,21 +31,26 @@ class TestToolConfigurationAssistantWidget(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Overridden method. Runs once before all tests in this class."""
-        try:
-            cls.app = QApplication().processEvents()
-        except RuntimeError:
-            pass
+        if not QApplication.instance():
+            QApplication()
         logging.basicConfig(
             stream=sys.stderr,
             level=logging.DEBUG,
             format='%(asctime)s %(levelname)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S',
         )
+        cls.parent_widget = QWidget()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Overridden method. Runs once after all tests in this class."""
+        cls.parent_widget.deleteLater()
+        cls.parent_widget = None
 
     def setUp(self):
         """Overridden method. Runs before each test."""
         with patch("spinetoolbox.widgets.tool_configuration_assistant_widget.SpineModelConfigurationAssistant"):
-            self.widget = ToolConfigurationAssistantWidget(QWidget(), autorun=False)
+            self.widget = ToolConfigurationAssistantWidget(self.parent_widget, autorun=False)
             self.assistant = self.widget.spine_model_config_asst
 
     def tearDown(self):